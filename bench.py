@@ -0,0 +1,152 @@
+"""Time the phases of a conversion and track their peak memory on synthetic logs of growing size"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from transform import EventLog, JsonOcelWriter, LogIndex, append_event, build_ocel, build_tree, init_worker, \
+    iter_trace, merge_trace, new_data, peak_rss, read_index, reset_peak_rss, write_ocel
+
+SCALES = [1000, 10000, 100000, 1000000, 10000000]
+PHASES = ['tree', 'parse', 'normalize', 'index', 'build', 'write']
+
+
+def run_phases(index_path, output):
+    """Convert like transform.convert, timing each phase; returns {phase: (seconds, peak bytes)}"""
+    trace_dir = os.path.dirname(index_path)
+    results = {}
+
+    reset_peak_rss()
+    start = time.perf_counter()
+    indented_text, ots, subprocesses = read_index(index_path)
+    root, jobs = build_tree(indented_text)
+    results['tree'] = (time.perf_counter() - start, peak_rss())
+
+    # Parsing and normalizing alternate per trace, both share the peak of their common window
+    reset_peak_rss()
+    init_worker(subprocesses, trace_dir)
+    log_final = EventLog()
+    data = new_data()
+    parse = normalize = 0.0
+    for ot_parent, ot_child, oid_parent, oid_child in jobs:
+        start = time.perf_counter()
+        events = list(iter_trace(oid_child, trace_dir=trace_dir))[1:]
+        lap = time.perf_counter()
+        log, e_data = EventLog(), new_data()
+        for event in events:
+            append_event(ot_parent, ot_child, oid_parent, oid_child, event, log, e_data, subprocesses)
+        merge_trace(log_final, data, log, e_data)
+        parse += lap - start
+        normalize += time.perf_counter() - lap
+    del events, log, e_data
+    results['parse'] = (parse, peak_rss())
+    results['normalize'] = (normalize, results['parse'][1])
+
+    reset_peak_rss()
+    start = time.perf_counter()
+    LogIndex(log_final, data)
+    results['index'] = (time.perf_counter() - start, peak_rss())
+
+    # Building is lazy, so it is measured by draining the generators without a writer
+    reset_peak_rss()
+    start = time.perf_counter()
+    write_ocel([], *build_ocel(log_final, data, ots, subprocesses))
+    build = time.perf_counter() - start
+    results['build'] = (build, peak_rss())
+
+    reset_peak_rss()
+    start = time.perf_counter()
+    n_events, n_objects = write_ocel([JsonOcelWriter(output)], *build_ocel(log_final, data, ots, subprocesses))
+    results['write'] = (max(0.0, time.perf_counter() - start - build), peak_rss())
+    results['events'] = n_events
+    results['objects'] = n_objects
+    return results
+
+
+def prepare(directory, events, options):
+    """Generate the log of a scale unless the same one already exists in directory"""
+    from generate import generate
+    settings = dict(options, events=events)
+    marker = os.path.join(directory, 'generated.json')
+    try:
+        with open(marker) as f:
+            if json.load(f)['settings'] == settings:
+                return
+    except (OSError, ValueError, KeyError):
+        pass
+    if os.path.isdir(directory):
+        for name in os.listdir(directory):
+            if name.endswith('.xes.yaml') or name in ('index.txt', 'generated.json'):
+                os.remove(os.path.join(directory, name))
+    summary = generate(directory, events, **options)
+    with open(marker, 'w') as f:
+        json.dump({'settings': settings, 'summary': summary}, f)
+
+
+def bench(scales=SCALES, data_dir=None, options=None):
+    """Benchmark every scale in a fresh interpreter, so peak memory is not inherited from smaller runs"""
+    data_dir = os.path.join(tempfile.gettempdir(), 'cpee-bench') if data_dir is None else data_dir
+    options = {} if options is None else options
+    for events in scales:
+        directory = os.path.join(data_dir, str(events))
+        prepare(directory, events, options)
+        with tempfile.TemporaryDirectory() as tmp:
+            proc = subprocess.run([sys.executable, os.path.abspath(__file__), '--phases',
+                                   os.path.join(directory, 'index.txt'), os.path.join(tmp, 'out.jsonocel')],
+                                  stdout=subprocess.PIPE, check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        yield events, json.loads(proc.stdout)
+
+
+def report(events, result, baseline=None):
+    print(f"{result['events']} events, {result['objects']} objects (scale {events})")
+    for phase in PHASES:
+        seconds, peak = result[phase]
+        line = f"  {phase:<10} {seconds:10.3f} s {peak / 2 ** 20:10.1f} MiB"
+        if baseline is not None and str(events) in baseline:
+            before = baseline[str(events)][phase][0]
+            line += f" {seconds / before:8.2f}x" if before else ""
+        print(line)
+    print(f"  {'total':<10} {sum(result[p][0] for p in PHASES):10.3f} s")
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Benchmark transform.py phase by phase on synthetic logs.")
+    parser.add_argument('scales', nargs='*', type=int, default=SCALES,
+                        help="numbers of events to benchmark (default: 1k to 10M)")
+    parser.add_argument('--data-dir', help="where generated logs are kept between runs (default: a temp directory)")
+    parser.add_argument('--save', help="write the results as JSON to this file")
+    parser.add_argument('--baseline', help="results of an earlier --save to compare the timings against")
+    parser.add_argument('--events-per-trace', type=int, default=20)
+    parser.add_argument('--payload-size', type=int, default=32)
+    parser.add_argument('--components', type=int, default=4)
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--instantiation-share', type=float, default=0.05)
+    parser.add_argument('--receiving-share', type=float, default=0.5)
+    parser.add_argument('--stream-share', type=float, default=0.1)
+    parser.add_argument('--phases', nargs=2, metavar=('INDEX', 'OUTPUT'), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.phases:
+        json.dump(run_phases(*args.phases), sys.stdout)
+        return 0
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    options = {'events_per_trace': args.events_per_trace, 'payload_size': args.payload_size,
+               'components': args.components, 'depth': args.depth, 'instantiation_share': args.instantiation_share,
+               'receiving_share': args.receiving_share, 'stream_share': args.stream_share}
+    results = {}
+    for events, result in bench(args.scales, args.data_dir, options):
+        report(events, result, baseline)
+        results[str(events)] = result
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=1)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
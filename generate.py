@@ -0,0 +1,167 @@
+"""Generate synthetic CPEE XES-YAML traces and their index.txt for testing and benchmarking transform.py"""
+import json
+import os
+import random
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from transform import CONCEPT_ENDPOINT, CONCEPT_INSTANCE, CONCEPT_NAME, CPEE_ACT_ID, CPEE_INSTANCE_UUID, \
+    CPEE_INSTANTIATION, CPEE_LIFECYCLE, CPEE_RAW, CPEE_RECEIVING, CPEE_STATE, CPEEID, DATA, EVENT, ID, LIFECYCLE, \
+    TIME, XES_DATACONTEXT, XES_DATASTREAM, XES_DATASTREAM_NAME, XES_DATASTREAM_SOURCE
+
+ACTIVITIES = ["Measure", "Drill", "Mill", "Turn", "Inspect", "Pack", "Transport", "Clean"]
+SUBPROCESS_TYPES = ["Order", "Production", "Measuring", "Transport", "Maintenance"]
+START = datetime(2019, 11, 14, 19, 0, 0, tzinfo=timezone(timedelta(hours=1)))
+# Distinct values per payload size, so repeated payloads occur as in real logs
+PAYLOAD_VARIANTS = 64
+
+
+class LogGenerator:
+    """Writes traces whose subprocesses are instantiated and received back like CPEE does.
+
+    Every trace gets about events_per_trace events. Each step of a trace instantiates a subprocess with probability
+    instantiation_share (while the tree is shallower than depth), emits a datastream event with probability
+    stream_share and otherwise calls an activity, which is received with probability receiving_share.
+    """
+
+    def __init__(self, directory, events_per_trace=20, depth=3, payload_size=32, components=4,
+                 instantiation_share=0.05, receiving_share=0.5, stream_share=0.1, seed=0):
+        self.directory = directory
+        self.events_per_trace = events_per_trace
+        self.depth = depth
+        self.instantiation_share = instantiation_share
+        self.receiving_share = receiving_share
+        self.stream_share = stream_share
+        self.random = random.Random(seed)
+        self.components = [f"device{i}" for i in range(components)]
+        self.payloads = [''.join(self.random.choices('abcdefghijklmnopqrstuvwxyz0123456789', k=payload_size))
+                         for _ in range(PAYLOAD_VARIANTS)]
+        self.lines = []
+        self.traces = 0
+        self.events = 0
+        try:
+            from yaml import CSafeDumper as Dumper
+        except ImportError:
+            from yaml import SafeDumper as Dumper
+        self.dumper = Dumper
+
+    def uuid(self):
+        return str(uuid.UUID(int=self.random.getrandbits(128), version=4))
+
+    def data(self):
+        return [{"name": "value", "value": self.random.choice(self.payloads)}]
+
+    def instance(self, ot, level, clock, oid=None):
+        """Write the trace of an instance of type ot and, depth first, of its subprocesses"""
+        import yaml
+        oid = self.uuid() if oid is None else oid
+        self.lines.append(f"{' ' * 2 * level}{ot} ({oid})")
+        number = self.random.randint(1, 99999)
+        events = []
+
+        def event(name, aid, lifecycle, cpee_lifecycle, **attributes):
+            clock[0] += timedelta(milliseconds=self.random.randint(1, 2000))
+            e = {CONCEPT_INSTANCE: number, CONCEPT_NAME: name, ID: name.lower(), CPEEID: oid,
+                 LIFECYCLE: lifecycle, CPEE_LIFECYCLE: cpee_lifecycle, TIME: clock[0]}
+            if aid is not None:
+                e[CPEE_ACT_ID] = aid
+            e.update(attributes)
+            events.append({EVENT: e})
+
+        budget = max(1, round(self.events_per_trace * self.random.uniform(0.5, 1.5)))
+        while len(events) < budget:
+            roll = self.random.random()
+            aid = self.uuid()
+            if roll < self.instantiation_share and level < self.depth:
+                child_ot = self.random.choice(SUBPROCESS_TYPES[1:])
+                name = f"Start {child_ot}"
+                child = self.uuid()
+                event(name, aid, "unknown", CPEE_INSTANTIATION,
+                      **{CPEE_RAW: {CPEE_INSTANCE_UUID: child, "CPEE-INSTANCE": number}})
+                child_clock = [clock[0]]
+                self.instance(child_ot, level + 1, child_clock, child)
+                clock[0] = child_clock[0]
+                event(name, aid, "unknown", CPEE_RECEIVING, **{CPEE_RAW: [
+                    {"name": "result", "mimetype": "application/json",
+                     DATA: json.dumps({"CPEE-INSTANCE": number, CPEE_INSTANCE_UUID: child, CPEE_STATE: "finished"})}]})
+            elif roll < self.instantiation_share + self.stream_share:
+                component = self.random.choice(self.components)
+                stream = {XES_DATASTREAM: [{XES_DATASTREAM_NAME: component},
+                                           {XES_DATASTREAM_SOURCE: f"{component}/sensor"},
+                                           {"stream:point": {"stream:value": self.random.randint(0, 100)}}]}
+                if self.random.random() < 0.3:
+                    stream[XES_DATACONTEXT] = [{XES_DATASTREAM_NAME: component},
+                                               {XES_DATASTREAM_SOURCE: f"{component}/context"},
+                                               {"context": self.random.randint(0, 3)}]
+                event(self.random.choice(ACTIVITIES), aid, "unknown", "stream/data", **stream)
+            else:
+                name = self.random.choice(ACTIVITIES)
+                endpoint = {CONCEPT_ENDPOINT: f"https://centurio.work/ing/{self.random.choice(self.components)}/"
+                                              f"{name.lower()}"}
+                event(name, aid, "start", "activity/calling", **endpoint, **{DATA: self.data()})
+                if self.random.random() < self.receiving_share:
+                    event(name, aid, "unknown", CPEE_RECEIVING, **endpoint, **{CPEE_RAW: [
+                        {"name": "result", "mimetype": "text/plain", DATA: self.random.choice(self.payloads)}]})
+                event(name, aid, "complete", "activity/done", **endpoint, **{DATA: self.data()})
+        event(ot, None, "complete", "description/done")
+        with open(os.path.join(self.directory, f"{oid}.xes.yaml"), 'w') as f:
+            yaml.dump_all(chain_documents({"log": {"trace": {CONCEPT_NAME: oid}}}, events), f, Dumper=self.dumper,
+                          explicit_start=True, allow_unicode=True)
+        self.traces += 1
+        self.events += len(events)
+        return oid
+
+    def generate(self, events=None, instances=None):
+        """Write the given number of root instances, or root instances until at least the given number of events"""
+        os.makedirs(self.directory, exist_ok=True)
+        clock = [START]
+        roots = 0
+        while (roots < instances) if instances is not None else (self.events < events):
+            self.instance(SUBPROCESS_TYPES[0], 0, clock)
+            roots += 1
+        with open(os.path.join(self.directory, 'index.txt'), 'w') as f:
+            f.write('\n'.join(self.lines) + '\n')
+        return {'instances': roots, 'traces': self.traces, 'events': self.events}
+
+
+def chain_documents(header, events):
+    yield header
+    yield from events
+
+
+def generate(directory, events=1000, instances=None, **options):
+    """Generate a log of the given number of root instances, or of at least the given number of events, into directory.
+
+    See LogGenerator for the options.
+    """
+    return LogGenerator(directory, **options).generate(events, instances)
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Generate a synthetic CPEE log for transform.py.")
+    parser.add_argument('directory', help="directory receiving index.txt and the traces")
+    parser.add_argument('-n', '--events', type=int, default=1000, help="minimum number of events (default: 1000)")
+    parser.add_argument('-i', '--instances', type=int,
+                        help="number of root instances, each with its subprocesses, instead of a number of events")
+    parser.add_argument('--events-per-trace', type=int, default=20, help="mean events per trace (default: 20)")
+    parser.add_argument('--depth', type=int, default=3, help="maximum subprocess nesting depth (default: 3)")
+    parser.add_argument('--payload-size', type=int, default=32, help="characters per data payload (default: 32)")
+    parser.add_argument('--components', type=int, default=4, help="number of datastream components (default: 4)")
+    parser.add_argument('--instantiation-share', type=float, default=0.05,
+                        help="share of steps instantiating a subprocess (default: 0.05)")
+    parser.add_argument('--receiving-share', type=float, default=0.5,
+                        help="share of activities with an activity/receiving event (default: 0.5)")
+    parser.add_argument('--stream-share', type=float, default=0.1,
+                        help="share of steps emitting a datastream event (default: 0.1)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    options = vars(args)
+    result = generate(options.pop('directory'), **options)
+    print(f"Wrote {result['events']} events in {result['traces']} traces of {result['instances']} root instances.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
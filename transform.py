@@ -1,12 +1,19 @@
 import uuid
-from typing import List, Any
-import ast
+from typing import List, Any, Iterator
 import pickle
+import os
+import sys
+import hashlib
+import re
+import time
+import heapq
+from array import array
+from functools import lru_cache
+from contextlib import contextmanager, nullcontext
 
-from yaml import load_all, FullLoader, dump
 import json
-
-import pm4py
+from itertools import chain
+from collections import deque
 
 from datetime import date, datetime
 
@@ -24,6 +31,20 @@ def json_serial(obj):
     raise TypeError("Type %s not serializable" % type(obj))
 
 
+def json_encoder(indent=None):
+    """Returns a function encoding values to JSON bytes, using orjson for the indentations it supports"""
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return lambda obj: orjson.dumps(obj, default=json_serial, option=option)
+    encoder = json.JSONEncoder(indent=indent, separators=(',', ':') if indent is None else (',', ': '),
+                               default=json_serial)
+    return lambda obj: encoder.encode(obj).encode()
+
+
 OCEL_GLOBAL = "ocel:global-log"
 OCEL_VERSION = "ocel:version"
 OCEL_VERSION = "ocel:version"
@@ -41,8 +62,11 @@ OCEL_OMAP = "ocel:omap"
 OCEL_VMAP = "ocel:vmap"
 OCEL_OVMAP = "ocel:ovmap"
 OCEL_NA = "__INVALID__"
+OCEL_EID = "ocel:eid"
+OCEL_OID = "ocel:oid"
 
-PATH_PREFIX = ''
+# Default size limit of the normalized trace cache in bytes
+CACHE_LIMIT = 2 ** 30
 CONCEPT_INSTANCE = 'concept:instance'
 CONCEPT_NAME = 'concept:name'
 CONCEPT_ENDPOINT = 'concept:endpoint'
@@ -76,62 +100,136 @@ NAMESPACE_RESOURCES = "workflow:resources"
 NAMESPACE_WORKFLOW = "workflow"
 CPEE_TIME_STRING = "%Y-%m-%dT%H:%M:%S.%f"
 LC_DELIMITER = "§"
+STATS = "stats"
+DEDUP_PAYLOADS = "dedup:payloads"
+DEDUP_BYTES = "dedup:bytes"
+MALFORMED_RAW = "raw:malformed"
+SKIPPED_EVENTS = "events:skipped"
+# Slowest traces kept in the run report
+SLOWEST_TRACES = 20
+# Bytes of a trace read at once when following, a larger document is read whole
+FOLLOW_BLOCK = 2 ** 20
+# Start of a YAML document in a trace
+DOCUMENT_START = re.compile(rb'^---', re.MULTILINE)
+# CPEE-STATE and CPEE-INSTANCE-UUID as JSON members or HTTP headers
+RAW_FIELD = re.compile(r'(CPEE-STATE|CPEE-INSTANCE-UUID)\W+([\w-]+)', re.IGNORECASE)
+# Payload subtrees dropped from the parsed events unless the cpee lifecycle transition needs them
+TRACE_SKIP = {CPEE_RAW: {CPEE_INSTANTIATION, CPEE_RECEIVING}}
 
 
 class Node:
-    def __init__(self, indented_line):
+    def __init__(self, indented_line, lineno=None):
         self.children = []
+        self.child_level = None
+        self.lineno = lineno
         self.level = len(indented_line) - len(indented_line.lstrip())
         s = indented_line.strip().split('(')
         self.ot = s[0].strip()
-        self.oid = s[1].split(')')[0]
-
-    def add_children(self, nodes, log, data, sub, fail):
-        childlevel = nodes[0].level
-        while nodes:
-            node = nodes.pop(0)
-            if node.level == childlevel:  # add node as a child
-                self.children.append(node)
-                try:
-                    temp_trace = read_trace(node.oid)
-                    # sub[node.oid] = [temp_trace[0], None]
-                    # sub[node.oid][1] = self.ot
-                    temp_trace = temp_trace[1:]
-                    for event in temp_trace:
-                        append_event(self.ot, node.ot, self.oid, node.oid, event, log, ots, data, sub)
-                except FileNotFoundError:
-                    print(f"Could not read {node.oid}.\n")
-                    fail.append(node.oid)
-            elif node.level > childlevel:  # add nodes as grandchildren of the last child
-                nodes.insert(0, node)
-                self.children[-1].add_children(nodes, log_final, data, sub, fail)
-            elif node.level <= self.level:  # this node is a sibling, no more children
-                nodes.insert(0, node)
-                return
-            pass
+        self.oid = s[1].split(')')[0].strip()
+
+    def add_children(self, nodes, jobs):
+        """Attach indented nodes below this one in a single forward scan, collecting their jobs in order"""
+        for parent, node in attach_nodes([self], nodes):
+            parent.children.append(node)
+            # Traces are ingested later in the order their jobs are collected here
+            jobs.append((parent.ot, node.ot, parent.oid, node.oid))
 
     def as_dict(self):
-        if len(self.children) > 1:
-            return {self.oid: [node.as_dict() for node in self.children]}
-        elif len(self.children) == 1:
-            return {self.oid: self.children[0].as_dict()}
-        else:
-            return self.oid
+        # Built bottom-up from a preorder, so deep trees do not hit the recursion limit
+        preorder = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            preorder.append(node)
+            stack.extend(node.children)
+        result = {}
+        for node in reversed(preorder):
+            children = [result.pop(id(child)) for child in node.children]
+            if len(children) > 1:
+                result[id(node)] = {node.oid: children}
+            elif len(children) == 1:
+                result[id(node)] = {node.oid: children[0]}
+            else:
+                result[id(node)] = node.oid
+        return result[id(self)]
+
+
+def attach_nodes(stack, nodes):
+    """Yield each indented node with its parent in a single forward scan.
+
+    stack holds the open ancestors of the next node with the root at the bottom and is updated in place, so a later
+    call continues the scan with the nodes that follow.
+    """
+    for node in nodes:
+        while len(stack) > 1 and node.level <= stack[-1].level:
+            stack.pop()
+        parent = stack[-1]
+        if parent.child_level is None:
+            parent.child_level = node.level
+        elif parent.child_level != node.level:
+            raise ValueError(f"Line {node.lineno}: indentation of {node.ot} ({node.oid}) is {node.level}, "
+                             f"but its siblings are indented by {parent.child_level}")
+        yield parent, node
+        stack.append(node)
+
+
+@lru_cache(maxsize=None)
+def trace_loader():
+    try:
+        # libyaml bindings are several times faster than the pure-Python loader
+        from yaml import CSafeLoader as TraceLoader
+    except ImportError:
+        from yaml import SafeLoader as TraceLoader
+    return TraceLoader
+
+
+def trace_path(uuid, trace_dir=''):
+    return os.path.join(trace_dir, f'{uuid}.xes.yaml')
+
+
+def read_trace(uuid, trace_dir='') -> List[Any]:
+    return list(iter_trace(uuid, skip={}, trace_dir=trace_dir))
 
 
-def read_trace(uuid) -> List[Any]:
-    with open(f'{PATH_PREFIX}{uuid}.xes.yaml') as f:
-        temp_trace = load_all(f, Loader=FullLoader)
-        temp_trace = [i for i in temp_trace]
-    return temp_trace
+def iter_trace(uuid, skip=None, trace_dir='') -> Iterator[Any]:
+    """Lazily parse the documents of a trace, pruning the payload subtrees in skip before construction"""
+    with open(trace_path(uuid, trace_dir)) as f:
+        yield from iter_documents(f, skip)
 
 
-def append_event(ot_parent, ot_child, oid_parent, oid_child, event, log, e_ots, e_data, sub):
+def iter_documents(stream, skip=None) -> Iterator[Any]:
+    skip = TRACE_SKIP if skip is None else skip
+    loader = trace_loader()(stream)
+    try:
+        while loader.check_node():
+            node = loader.get_node()
+            if skip:
+                prune_event(node, skip)
+            yield loader.construct_document(node)
+    finally:
+        loader.dispose()
+
+
+def prune_event(node, skip):
+    # Works on the composed node graph, so skipped payloads are never turned into Python objects
+    if node.id != 'mapping':
+        return
+    for key, value in node.value:
+        if key.value == EVENT and value.id == 'mapping':
+            lifecycle = next((v.value for k, v in value.value if k.value == CPEE_LIFECYCLE), None)
+            value.value = [(k, v) for k, v in value.value if k.value not in skip or lifecycle in skip[k.value]]
+
+
+def append_event(ot_parent, ot_child, oid_parent, oid_child, event, log, e_data, sub, dedup=False):
+    if TIME not in event[EVENT]:
+        e_data[STATS][SKIPPED_EVENTS] += 1
+        return
+    row = {}
+    objects = [(ot_child, oid_child)]
     if event[EVENT][CPEE_LIFECYCLE] == "stream/data":
         if XES_DATASTREAM in event[EVENT]:
-            data_id = str(uuid.uuid4())
-            e_data[DATASTREAM][data_id] = event[EVENT][XES_DATASTREAM]
-            log[XES_DATASTREAM].append(data_id)
+            data_id = store_payload(e_data, DATASTREAM, event[EVENT][XES_DATASTREAM], dedup)
+            row[XES_DATASTREAM] = data_id
             if str(event[EVENT][XES_DATASTREAM]).find("context") != -1:
                 e_data[DATASTREAM_TO][data_id] = "TODO"
             else:
@@ -150,271 +248,1584 @@ def append_event(ot_parent, ot_child, oid_parent, oid_child, event, log, e_ots,
                 # e_data[DATASTREAM_TO][data_id] = [oid_child, event[EVENT][CPEE_ACT_ID]]
             # set_nonoptional(event, log, DATASTREAM)
         else:
-            log[XES_DATASTREAM].append(DUMMY)
+            row[XES_DATASTREAM] = DUMMY
         if XES_DATACONTEXT in event[EVENT]:
-            data_id = str(uuid.uuid4())
-            e_data[DATASTREAM][data_id] = event[EVENT][XES_DATACONTEXT]
-            log[XES_DATACONTEXT].append(data_id)
+            data_id = store_payload(e_data, DATASTREAM, event[EVENT][XES_DATACONTEXT], dedup)
+            row[XES_DATACONTEXT] = data_id
             # set_nonoptional(event, log, DATACONTEXT)
         else:
-            log[XES_DATACONTEXT].append(DUMMY)
+            row[XES_DATACONTEXT] = DUMMY
     else:
-        log[XES_DATASTREAM].append(DUMMY)
-        log[XES_DATACONTEXT].append(DUMMY)
+        row[XES_DATASTREAM] = DUMMY
+        row[XES_DATACONTEXT] = DUMMY
     if DATA in event[EVENT]:
-        data_id = str(uuid.uuid4())
-        e_data[DATA][data_id] = event[EVENT][DATA]
-        log[DATA].append(data_id)
-    else:
-        log[DATA].append(DUMMY)
-    if TIME in event[EVENT]:
-        set_attribute(event, log, TIME)
+        data_id = store_payload(e_data, DATA, event[EVENT][DATA], dedup)
+        row[DATA] = data_id
     else:
-        return
-    set_attribute(event, log, CONCEPT_INSTANCE)
+        row[DATA] = DUMMY
+    set_attribute(event, row, TIME)
+    set_attribute(event, row, CONCEPT_INSTANCE)
     if CONCEPT_NAME in event[EVENT]:
-        set_attribute(event, log, CONCEPT_NAME)
+        set_attribute(event, row, CONCEPT_NAME)
     else:
-        log[CONCEPT_NAME].append(EXTERNAL)
+        row[CONCEPT_NAME] = EXTERNAL
     if CONCEPT_ENDPOINT in event[EVENT]:
-        set_attribute(event, log, CONCEPT_ENDPOINT)
+        set_attribute(event, row, CONCEPT_ENDPOINT)
     else:
-        log[CONCEPT_ENDPOINT].append(DUMMY)
+        row[CONCEPT_ENDPOINT] = DUMMY
     if CPEE_ACT_ID in event[EVENT]:
-        set_attribute(event, log, CPEE_ACT_ID)
-        if log[CONCEPT_NAME][-1] in e_data[ACTIVITY_TO_INSTANCE]:
-            if event[EVENT][CPEE_ACT_ID] in e_data[ACTIVITY_TO_INSTANCE][log[CONCEPT_NAME][-1]]:
-                e_data[ACTIVITY_TO_INSTANCE][log[CONCEPT_NAME][-1]][event[EVENT][CPEE_ACT_ID]] += 1
-            else:
-                e_data[ACTIVITY_TO_INSTANCE][log[CONCEPT_NAME][-1]][event[EVENT][CPEE_ACT_ID]] = 1
-        else:
-            e_data[ACTIVITY_TO_INSTANCE][log[CONCEPT_NAME][-1]] = {event[EVENT][CPEE_ACT_ID]: 1}
+        set_attribute(event, row, CPEE_ACT_ID)
     else:
-        log[CPEE_ACT_ID].append(EXTERNAL)
-        if log[CONCEPT_NAME][-1] in e_data[ACTIVITY_TO_INSTANCE]:
-            e_data[ACTIVITY_TO_INSTANCE][log[CONCEPT_NAME][-1]][EXTERNAL] += 1
-        else:
-            e_data[ACTIVITY_TO_INSTANCE][log[CONCEPT_NAME][-1]] = {EXTERNAL: 1}
-    set_attribute(event, log, ID)
-    set_attribute(event, log, CPEEID)
-    set_attribute(event, log, LIFECYCLE)
-    set_attribute(event, log, CPEE_LIFECYCLE)
+        row[CPEE_ACT_ID] = EXTERNAL
+    instances = e_data[ACTIVITY_TO_INSTANCE].setdefault(row[CONCEPT_NAME], {})
+    instances[row[CPEE_ACT_ID]] = instances.get(row[CPEE_ACT_ID], 0) + 1
+    set_attribute(event, row, ID)
+    set_attribute(event, row, CPEEID)
+    set_attribute(event, row, LIFECYCLE)
+    set_attribute(event, row, CPEE_LIFECYCLE)
     # Need to generalize this
     if CPEE_LIFECYCLE in event[EVENT] and event[EVENT][CPEE_LIFECYCLE] == CPEE_INSTANTIATION:
         # Task instantiation logic of CPEE
         oid_instantiate = event[EVENT][CPEE_RAW][CPEE_INSTANCE_UUID]
-        log[sub[oid_instantiate]].append(oid_instantiate)
-        log[SUB_ROOT].append(ot_child)
-        temp_e_ots = e_ots - {sub[oid_instantiate]}
+        objects.append((sub[oid_instantiate], oid_instantiate))
+        row[SUB_ROOT] = ot_child
     elif CPEE_LIFECYCLE in event[EVENT] and event[EVENT][CPEE_LIFECYCLE] == CPEE_RECEIVING and CPEE_RAW in event[
-        EVENT] and DATA in event[EVENT][CPEE_RAW][0] and CPEE_STATE in event[EVENT][CPEE_RAW][0][DATA]:
-        state = event[EVENT][CPEE_RAW][0][DATA].split(CPEE_STATE)[1].split('"')[2]
-        if state == "finished":
-            oid_instantiated = event[EVENT][CPEE_RAW][0][DATA].split(CPEE_INSTANCE_UUID)[1].split('"')[2]
+        EVENT]:
+        received = decode_raw(event[EVENT][CPEE_RAW])
+        if received is not None and received[0] == "finished" and received[1] is not None:
             # Wait running giving control back to callee logic of CPEE
-            # oid_instantiated = subprocess_dict[CPEE_INSTANCE_UUID]
-            log[sub[oid_instantiated]].append(oid_instantiated)
-            temp_e_ots = e_ots - {sub[oid_instantiated]}
-            log[SUB_ROOT].append(ot_child)
+            oid_instantiated = received[1]
+            objects.append((sub[oid_instantiated], oid_instantiated))
+            row[SUB_ROOT] = ot_child
             # This is in fact label splitting
-            log[CPEE_LIFECYCLE][-1] = "subprocess/receiving"
+            row[CPEE_LIFECYCLE] = "subprocess/receiving"
         else:
-            temp_e_ots = e_ots
-            log[SUB_ROOT].append(NA)
+            if received is not None and (received[0] is None or received[0] == "finished"):
+                e_data[STATS][MALFORMED_RAW] += 1
+            row[SUB_ROOT] = NA
     # elif CPEE_LIFECYCLE in event[EVENT] and event[EVENT][CPEE_LIFECYCLE] == "activity/receiving" and "concept:endpoint" in event[EVENT] and event[EVENT]["concept:endpoint"] == "https-get://centurio.work/ing/correlators/message/receive/" and "raw" in event[EVENT] and "data" in event[EVENT]["raw"] and "ok" in str(event[EVENT]["raw"]["data"]):
     # Only with domain knowledge possible to set this object id of the signalling subprocess that was forked
     else:
-        temp_e_ots = e_ots
-        log[SUB_ROOT].append(NA)
-    log[ot_child].append(oid_child)
-    temp_e_ots = temp_e_ots - set([ot_child, ROOT])
-    for t in temp_e_ots:
-        log[t].append(DUMMY)
+        row[SUB_ROOT] = NA
+    log.append(row, objects)
+
+
+def parse_raw(text):
+    try:
+        fields = json.loads(text)
+    except ValueError:
+        fields = None
+    if not isinstance(fields, dict) or CPEE_STATE not in fields:
+        # Header style payload or JSON with unexpected quoting
+        fields = {k.upper(): v for k, v in RAW_FIELD.findall(text)}
+    state, oid = fields.get(CPEE_STATE), fields.get(CPEE_INSTANCE_UUID)
+    return (state if isinstance(state, str) else None), (oid if isinstance(oid, str) else None)
+
 
+def decode_raw(raw):
+    """Return the subprocess state and instance uuid reported by a CPEE raw receive payload.
 
-def set_attribute(event, log, key):
+    None if the payload reports no subprocess state, either value is None if it cannot be extracted.
+    """
     try:
-        log[key].append(event[EVENT][key])
+        data = raw[0][DATA]
+    except (LookupError, TypeError):
+        return None
+    if isinstance(data, dict):
+        if CPEE_STATE not in data:
+            return None
+        return data[CPEE_STATE], data.get(CPEE_INSTANCE_UUID)
+    if not isinstance(data, str) or CPEE_STATE not in data:
+        return None
+    return parse_raw(data)
+
+
+def canonical_payload(payload):
+    try:
+        return json.dumps(payload, sort_keys=True, separators=(',', ':'), default=json_serial)
+    except TypeError:
+        # Keys of mixed types cannot be sorted
+        return json.dumps(payload, separators=(',', ':'), default=json_serial)
+
+
+def store_payload(e_data, kind, payload, dedup=False):
+    """Store a data or datastream payload and return its object id.
+
+    When deduplicating, the id is derived from the canonical content so identical payloads become one object.
+    """
+    if not dedup:
+        data_id = str(uuid.uuid4())
+        e_data[kind][data_id] = payload
+        return data_id
+    text = canonical_payload(payload)
+    data_id = str(uuid.UUID(bytes=hashlib.blake2b(f"{kind}:{text}".encode(), digest_size=16).digest()))
+    if data_id in e_data[kind]:
+        e_data[STATS][DEDUP_PAYLOADS] += 1
+        e_data[STATS][DEDUP_BYTES] += len(text)
+    else:
+        e_data[kind][data_id] = payload
+    return data_id
+
+
+def set_attribute(event, row, key):
+    try:
+        row[key] = event[EVENT][key]
     except KeyError:
-        log[key].append(NA)
-
-
-with open(PATH_PREFIX + 'index.txt') as f:
-    indented_text = f.read()
-
-    ots = {ot.strip().split('(')[0].strip() for ot in indented_text.splitlines() if ot.strip()}
-
-log_final = {CONCEPT_INSTANCE: [],
-             CONCEPT_NAME: [],
-             CONCEPT_ENDPOINT: [],
-             ID: [],
-             CPEEID: [],
-             LIFECYCLE: [],
-             CPEE_LIFECYCLE: [],
-             DATA: [],
-             TIME: [],
-             ROOT: [],
-             XES_DATASTREAM: [],
-             XES_DATACONTEXT: [],
-             CPEE_ACT_ID: [],
-             SUB_ROOT: []}
-
-for ot in ots:
-    log_final[ot] = []
-
-data = {DATA: {},
-        DATASTREAM: {},
-        DATASTREAM_TO: {
-            NAMESPACE_SUBPROCESS: {},
-            CPEE_ACT_ID: {}
-        },
-        ACTIVITY_TO_INSTANCE: {}}
-subprocesses = {ot.strip().split('(')[1].split(')')[0].strip(): ot.strip().split('(')[0].strip() for ot in
-                indented_text.splitlines() if ot.strip()}
-fail = []
-
-root = Node(f"{ROOT}({str(uuid.uuid4())})")
-root.add_children([Node(line) for line in indented_text.splitlines() if line.strip()], log_final, data, subprocesses,
-                  fail)
+        row[key] = NA
+
+
+class Column:
+    """Dictionary-encoded column, every distinct value is kept once and events hold its code"""
+
+    def __init__(self):
+        self.values = []
+        self.index = {}
+        self.codes = array('I')
+
+    def encode(self, value):
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def append(self, value):
+        self.codes.append(self.encode(value))
+
+    def extend(self, other):
+        remap = [self.encode(v) for v in other.values]
+        self.codes.extend([remap[c] for c in other.codes])
+
+    def __getitem__(self, i):
+        return self.values[self.codes[i]]
+
+    def __iter__(self):
+        values = self.values
+        return (values[c] for c in self.codes)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getstate__(self):
+        # The index is rebuilt from the values, no need to ship it between processes
+        return self.values, self.codes
+
+    def __setstate__(self, state):
+        self.values, self.codes = state
+        self.index = {v: c for c, v in enumerate(self.values)}
+
+
+# Low-cardinality attributes are dictionary-encoded, per-event ids and timestamps stay plain lists
+ENCODED_ATTRIBUTES = [CONCEPT_INSTANCE, CONCEPT_NAME, CONCEPT_ENDPOINT, ID, CPEEID, LIFECYCLE, CPEE_LIFECYCLE,
+                      CPEE_ACT_ID, SUB_ROOT]
+PLAIN_ATTRIBUTES = [DATA, TIME, XES_DATASTREAM, XES_DATACONTEXT]
+
+
+class EventLog:
+    """Columnar event store with a sparse event-to-object relation in place of one padded column per object type"""
+
+    def __init__(self):
+        self.columns = {k: Column() for k in ENCODED_ATTRIBUTES}
+        self.columns.update({k: [] for k in PLAIN_ATTRIBUTES})
+        # Objects of event i are objects[offsets[i]:offsets[i + 1]]
+        self.objects = Column()
+        self.offsets = array('L', [0])
+        self.object_types = {}
+
+    def append(self, row, objects):
+        for k, column in self.columns.items():
+            column.append(row[k])
+        for ot, oid in objects:
+            self.objects.append(oid)
+            self.object_types[oid] = ot
+        self.offsets.append(len(self.objects))
+
+    def extend(self, other):
+        for k, column in self.columns.items():
+            column.extend(other.columns[k])
+        base = self.offsets[-1]
+        self.objects.extend(other.objects)
+        self.offsets.extend([base + o for o in other.offsets[1:]])
+        self.object_types.update(other.object_types)
+
+    def omap(self, i):
+        objects = self.objects
+        return [objects[j] for j in range(self.offsets[i], self.offsets[i + 1])]
+
+    def __getitem__(self, key):
+        return self.columns[key]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+
+def new_data():
+    return {DATA: {},
+            DATASTREAM: {},
+            DATASTREAM_TO: {
+                NAMESPACE_SUBPROCESS: {},
+                CPEE_ACT_ID: {}
+            },
+            ACTIVITY_TO_INSTANCE: {},
+            STATS: {DEDUP_PAYLOADS: 0, DEDUP_BYTES: 0, MALFORMED_RAW: 0, SKIPPED_EVENTS: 0}}
+
+
+# Trace directory and subprocess types a worker process normalizes traces against
+_worker = {}
+
+
+def init_worker(sub, trace_dir='', fingerprint=False, dedup=False):
+    _worker['sub'] = sub
+    _worker['trace_dir'] = trace_dir
+    _worker['fingerprint'] = fingerprint
+    _worker['dedup'] = dedup
+
+
+def fingerprint_trace(path):
+    """Size, modification time and content hash of a trace file"""
+    st = os.stat(path)
+    digest = hashlib.blake2b()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return st.st_size, st.st_mtime_ns, digest.hexdigest()
+
+
+def ingest_trace(job):
+    """Parse and normalize a single trace into its own log and data fragment"""
+    ot_parent, ot_child, oid_parent, oid_child = job
+    log = EventLog()
+    e_data = new_data()
+    start = time.perf_counter()
+    try:
+        # Taken before parsing, a trace changing meanwhile is parsed again on the next run
+        path = trace_path(oid_child, _worker['trace_dir'])
+        fingerprint = fingerprint_trace(path) if _worker['fingerprint'] else None
+        temp_trace = iter_trace(oid_child, trace_dir=_worker['trace_dir'])
+        # First document is the log header
+        next(temp_trace, None)
+        for event in temp_trace:
+            append_event(ot_parent, ot_child, oid_parent, oid_child, event, log, e_data, _worker['sub'],
+                         _worker['dedup'])
+    except FileNotFoundError:
+        return oid_child, None, None, None, None
+    return oid_child, log, e_data, fingerprint, time.perf_counter() - start
+
+
+class TraceCache:
+    """On-disk cache of normalized traces, keyed on path, size, mtime and content hash.
+
+    Entries beyond limit bytes are evicted least recently used first when the cache is closed.
+    """
+    # Bump whenever the layout of cached fragments changes
+    VERSION = 4
+
+    def __init__(self, directory, limit=CACHE_LIMIT, trace_dir='', dedup=False):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.limit = limit
+        self.trace_dir = trace_dir
+        self.dedup = dedup
+        self.index_path = os.path.join(directory, 'index.pickle')
+        try:
+            with open(self.index_path, 'rb') as f:
+                version, self.entries = pickle.load(f)
+            if version != self.VERSION:
+                self.entries = {}
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+            self.entries = {}
+        self.clock = max((e['used'] for e in self.entries.values()), default=0)
+        self.hits = 0
+        self.misses = 0
+
+    def valid(self, job, sub):
+        """Whether the cached fragment of a job is still up to date, rehashing only files whose stat changed"""
+        ot_parent, ot_child, oid_parent, oid_child = job
+        path = trace_path(oid_child, self.trace_dir)
+        entry = self.entries.get(path)
+        if entry is None or entry['ot'] != ot_child or entry['dedup'] != self.dedup or \
+                any(sub.get(k) != v for k, v in entry['types'].items()):
+            return False
+        try:
+            st = os.stat(path)
+            if st.st_size != entry['size']:
+                return False
+            if st.st_mtime_ns != entry['mtime']:
+                if fingerprint_trace(path)[2] != entry['digest']:
+                    return False
+                entry['mtime'] = st.st_mtime_ns
+        except FileNotFoundError:
+            return False
+        return True
+
+    def get(self, job):
+        path = trace_path(job[3], self.trace_dir)
+        entry = self.entries[path]
+        try:
+            with open(os.path.join(self.directory, entry['file']), 'rb') as f:
+                t_log, t_data = pickle.load(f)
+        except (OSError, EOFError, AttributeError, pickle.UnpicklingError):
+            del self.entries[path]
+            return None
+        self.clock += 1
+        entry['used'] = self.clock
+        self.hits += 1
+        return t_log, t_data
+
+    def put(self, job, t_log, t_data, fingerprint):
+        path = trace_path(job[3], self.trace_dir)
+        name = hashlib.blake2b(path.encode(), digest_size=16).hexdigest() + '.pickle'
+        with open(os.path.join(self.directory, name), 'wb') as f:
+            pickle.dump((t_log, t_data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            nbytes = f.tell()
+        self.clock += 1
+        self.misses += 1
+        self.entries[path] = {'ot': job[1], 'types': t_log.object_types, 'dedup': self.dedup, 'size': fingerprint[0],
+                              'mtime': fingerprint[1], 'digest': fingerprint[2], 'file': name, 'bytes': nbytes,
+                              'used': self.clock}
+
+    def close(self):
+        total = sum(e['bytes'] for e in self.entries.values())
+        for path, entry in sorted(self.entries.items(), key=lambda e: e[1]['used']):
+            if total <= self.limit:
+                break
+            total -= entry['bytes']
+            del self.entries[path]
+            try:
+                os.remove(os.path.join(self.directory, entry['file']))
+            except FileNotFoundError:
+                pass
+        temp = self.index_path + '.tmp'
+        with open(temp, 'wb') as f:
+            pickle.dump((self.VERSION, self.entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, self.index_path)
+
+
+def merge_trace(log, e_data, t_log, t_data):
+    log.extend(t_log)
+    stats = e_data[STATS]
+    for k, n in t_data[STATS].items():
+        stats[k] += n
+    for kind in (DATA, DATASTREAM):
+        for data_id, payload in t_data[kind].items():
+            if data_id in e_data[kind]:
+                # Only content addressed ids repeat across traces
+                stats[DEDUP_PAYLOADS] += 1
+                stats[DEDUP_BYTES] += len(canonical_payload(payload))
+            else:
+                e_data[kind][data_id] = payload
+    for k, v in t_data[DATASTREAM_TO].items():
+        if k in (NAMESPACE_SUBPROCESS, CPEE_ACT_ID):
+            for oid, data_ids in v.items():
+                e_data[DATASTREAM_TO][k].setdefault(oid, []).extend(data_ids)
+        else:
+            e_data[DATASTREAM_TO][k] = v
+    for act, ids in t_data[ACTIVITY_TO_INSTANCE].items():
+        counts = e_data[ACTIVITY_TO_INSTANCE].setdefault(act, {})
+        for aid, n in ids.items():
+            counts[aid] = counts.get(aid, 0) + n
+
+
+def ingest(jobs, log, e_data, sub, fail, workers=1, cache=None, trace_dir='', dedup=False, report=None):
+    """Ingest the traces of all jobs, merging their fragments in job order so any worker count gives the same log.
+
+    With a cache only new or changed traces are parsed, all others are loaded from it. A report is told about
+    every trace as it is merged.
+    """
+    cached = [cache.valid(job, sub) for job in jobs] if cache is not None else [False] * len(jobs)
+    parse = [job for job, hit in zip(jobs, cached) if not hit]
+    init_worker(sub, trace_dir, cache is not None, dedup)
+    if workers > 1 and len(parse) > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(workers, initializer=init_worker,
+                                    initargs=(sub, trace_dir, cache is not None, dedup))
+        results = pool.imap(ingest_trace, parse, chunksize=max(1, len(parse) // (workers * 16)))
+    else:
+        pool = None
+        results = map(ingest_trace, parse)
+    try:
+        for job, hit in zip(jobs, cached):
+            fragment = cache.get(job) if hit else None
+            if fragment is not None:
+                merge_trace(log, e_data, *fragment)
+                if report is not None:
+                    report.trace(job[3], len(fragment[0]))
+                continue
+            oid, t_log, t_data, fingerprint, seconds = next(results) if not hit else ingest_trace(job)
+            if t_log is None:
+                print(f"Could not read {oid}.\n")
+                fail.append(oid)
+            else:
+                if cache is not None:
+                    cache.put(job, t_log, t_data, fingerprint)
+                merge_trace(log, e_data, t_log, t_data)
+            if report is not None:
+                report.trace(oid, None if t_log is None else len(t_log), seconds)
+    except BaseException:
+        # Closing would wait for every trace already queued to be parsed
+        if pool is not None:
+            pool.terminate()
+        raise
+    else:
+        if pool is not None:
+            pool.close()
+    finally:
+        if pool is not None:
+            pool.join()
+        if cache is not None:
+            cache.close()
+
+
+def peak_rss(children=False):
+    """High-water mark of the resident set size in bytes, of the largest worker process with children"""
+    if not children:
+        try:
+            with open('/proc/self/status') as f:
+                for line in f:
+                    if line.startswith('VmHWM:'):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    # Kilobytes on Linux, bytes on macOS
+    return usage.ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+
+
+def reset_peak_rss():
+    # Only Linux can reset the high-water mark, elsewhere peaks accumulate over the phases
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+@contextmanager
+def cprofile_phase(path):
+    """Profile the enclosed code with cProfile and dump the stats to path, for pstats or snakeviz"""
+    import cProfile
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+
+
+def format_duration(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02}:{seconds:02}"
+
+
+class RunReport:
+    """Wall time and peak memory of each phase and parse time and events of each trace of a conversion.
+
+    With progress the ingestion reports its progress and ETA on stderr. profiler is called with the name of the
+    phase given as profile and returns a context manager wrapping just that phase, for example cprofile_phase or a
+    sampling profiler.
+    """
+    # Seconds between progress updates
+    PROGRESS_INTERVAL = 0.5
+
+    def __init__(self, progress=False, profile=None, profiler=None, stream=None):
+        self.progress = progress
+        self.profile = profile
+        self.profiler = profiler
+        self.stream = sys.stderr if stream is None else stream
+        self.phases = {}
+        self.traces = {}
+        self.slowest = []
+        self.total = 0
+        self.events = 0
+        self.shown = 0.0
+        self.start = self.ingest_start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        reset_peak_rss()
+        profiler = self.profiler(name) if name == self.profile and self.profiler is not None else nullcontext()
+        start = time.perf_counter()
+        with profiler:
+            yield
+        self.phases[name] = {'seconds': time.perf_counter() - start, 'peak_rss': peak_rss()}
+
+    def expect(self, traces):
+        self.total = traces
+        self.ingest_start = time.perf_counter()
+
+    def trace(self, oid, events, seconds=None):
+        """Record a merged trace, events is None if it could not be read and seconds None if it came from the cache"""
+        self.traces[oid] = {'events': events, 'seconds': seconds}
+        if events is not None:
+            self.events += events
+        if seconds is not None:
+            entry = (seconds, oid)
+            if len(self.slowest) < SLOWEST_TRACES:
+                heapq.heappush(self.slowest, entry)
+            else:
+                heapq.heappushpop(self.slowest, entry)
+        if self.progress:
+            now = time.perf_counter()
+            if now - self.shown >= self.PROGRESS_INTERVAL or len(self.traces) == self.total:
+                self.shown = now
+                self.show(now)
+
+    def show(self, now):
+        done = len(self.traces)
+        elapsed = now - self.ingest_start
+        eta = elapsed / done * (self.total - done) if done else 0
+        self.stream.write(f"\r{done}/{self.total} traces, {self.events} events, {format_duration(elapsed)} elapsed, "
+                          f"ETA {format_duration(eta)}")
+        if done == self.total:
+            self.stream.write("\n")
+        self.stream.flush()
+
+    def as_dict(self, summary=None):
+        return {
+            'seconds': time.perf_counter() - self.start,
+            'peak_rss': peak_rss(),
+            'workers_peak_rss': peak_rss(children=True),
+            'phases': self.phases,
+            'summary': summary or {},
+            'slowest': [{'trace': oid, 'seconds': seconds, 'events': self.traces[oid]['events']}
+                        for seconds, oid in sorted(self.slowest, reverse=True)],
+            'traces': self.traces
+        }
+
+    def write(self, path, summary=None):
+        with open(path, 'w') as f:
+            json.dump(self.as_dict(summary), f, indent=1)
+
+
+class LogIndex:
+    """Indices derived from an ingested log in one pass over its activity instances"""
+
+    def __init__(self, log, e_data):
+        # Events per activity id, the first activity it occurs with and activities having an id with several events
+        self.counts = {}
+        self.activity = {}
+        self.multiple = {}
+        for act, ids in e_data[ACTIVITY_TO_INSTANCE].items():
+            self.multiple[act] = False
+            for aid, n in ids.items():
+                self.counts[aid] = self.counts.get(aid, 0) + n
+                self.activity.setdefault(aid, act)
+                if n > 1:
+                    self.multiple[act] = True
+        # Activity ids of single events whose activity never has more than one event per id, i.e. no lifecycle
+        self.no_lifecycles = {aid: self.activity[aid] for aid, n in self.counts.items()
+                              if n == 1 and not self.multiple[self.activity[aid]]}
+        # The last activity an activity id occurs with names its lifecycle type
+        aids, concepts = log[CPEE_ACT_ID], log[CONCEPT_NAME]
+        self.lifecycle_types = {aids.values[a]: concepts.values[c] for a, c in zip(aids.codes, concepts.codes)}
+
+
+class ComponentMatcher:
+    """Aho-Corasick automaton mapping endpoints to the component whose name they contain.
+
+    If several component names occur in an endpoint the longest one wins, among equally long ones the one occurring
+    first. Endpoints without any component name map to default. Results are memoized per endpoint.
+    """
+
+    def __init__(self, components, default=None):
+        self.default = default
+        self.memo = {}
+        self.goto = [{}]
+        # Longest component name ending in each state, following the failure links
+        self.out = [None]
+        for name, value in components.items():
+            name = str(name)
+            if not name:
+                continue
+            state = 0
+            for char in name:
+                if char not in self.goto[state]:
+                    self.goto.append({})
+                    self.out.append(None)
+                    self.goto[state][char] = len(self.goto) - 1
+                state = self.goto[state][char]
+            self.out[state] = (len(name), value)
+        self.fail = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                if state:
+                    fallback = self.fail[state]
+                    while fallback and char not in self.goto[fallback]:
+                        fallback = self.fail[fallback]
+                    self.fail[child] = self.goto[fallback].get(char, 0)
+                if self.out[child] is None:
+                    self.out[child] = self.out[self.fail[child]]
+
+    def match(self, endpoint):
+        if endpoint in self.memo:
+            return self.memo[endpoint]
+        goto, fail, out = self.goto, self.fail, self.out
+        best = None
+        state = 0
+        for char in str(endpoint):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state] is not None:
+                # Only strictly longer names replace the best match, so equally long ones keep the leftmost
+                if best is None or out[state][0] > best[0]:
+                    best = out[state]
+        result = best[1] if best is not None else self.default
+        self.memo[endpoint] = result
+        return result
+
+
+class JsonOcelWriter:
+    """Writes OCEL JSON incrementally, events and objects go to disk as soon as they are produced"""
+
+    def __init__(self, path, indent=2, compress=None):
+        if compress is None:
+            compress = str(path).endswith('.gz')
+        if compress:
+            import gzip
+            self.file = gzip.open(path, 'wb')
+        else:
+            self.file = open(path, 'wb')
+        self.indent = indent
+        self.encode = json_encoder(indent)
+        self.colon = b':' if indent is None else b': '
+        self.section = None
+        # Entries written so far on the top level and in the current section
+        self.items = [0, 0]
+
+    def begin(self, header):
+        self.file.write(b'{')
+        for k, v in header.items():
+            self._entry(k, v, 1)
+
+    def event(self, eid, event):
+        if self.section == OCEL_OBJECTS:
+            raise ValueError("All events have to be written before the first object")
+        self._enter(OCEL_EVENTS)
+        self._entry(eid, event, 2)
+
+    def object(self, oid, obj):
+        self._enter(OCEL_OBJECTS)
+        self._entry(oid, obj, 2)
+
+    def close(self):
+        self._enter(OCEL_OBJECTS)
+        self._leave()
+        self.file.write(self._newline(0) + b'}')
+        self.file.close()
+
+    def _newline(self, depth):
+        return b'' if self.indent is None else b'\n' + b' ' * (self.indent * depth)
+
+    def _key(self, key, depth):
+        self.file.write((b',' if self.items[depth - 1] else b'') + self._newline(depth) + self.encode(key) + self.colon)
+        self.items[depth - 1] += 1
+
+    def _entry(self, key, value, depth):
+        text = self.encode(value)
+        if self.indent is not None:
+            # Encoded strings never contain raw newlines, so this only re-indents the structure
+            text = text.replace(b'\n', self._newline(depth))
+        self._key(key, depth)
+        self.file.write(text)
+
+    def _enter(self, section):
+        if self.section == section:
+            return
+        if self.section is None and section == OCEL_OBJECTS:
+            self._enter(OCEL_EVENTS)
+        self._leave()
+        self._key(section, 1)
+        self.file.write(b'{')
+        self.section = section
+        self.items[1] = 0
+
+    def _leave(self):
+        if self.section is not None:
+            self.file.write((self._newline(1) if self.items[1] else b'') + b'}')
+            self.section = None
+
+
+def sql_value(value):
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return json.dumps(value, default=json_serial)
+
+
+class SqliteOcelWriter:
+    """Writes an OCEL 2.0 style SQLite database with batched inserts, indexes are only created once loaded.
+
+    A live database is indexed right away instead, as it is read while it grows.
+    """
+
+    def __init__(self, path, batch_size=10000, live=False):
+        import sqlite3
+        if os.path.exists(path):
+            os.remove(path)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode = MEMORY")
+        self.connection.execute("PRAGMA synchronous = OFF")
+        self.batch_size = batch_size
+        self.rows = {}
+        self.pending = 0
+        # Per type tables, keyed by event or object type
+        self.tables = {}
+        self.attn = []
+        self.live = live
+
+    def begin(self, header):
+        self.attn = header[OCEL_GLOBAL][OCEL_ATTN]
+        self.connection.executescript('''
+            CREATE TABLE event (ocel_id TEXT, ocel_type TEXT);
+            CREATE TABLE event_map_type (ocel_type TEXT, ocel_type_map TEXT);
+            CREATE TABLE object (ocel_id TEXT, ocel_type TEXT);
+            CREATE TABLE object_map_type (ocel_type TEXT, ocel_type_map TEXT);
+            CREATE TABLE event_object (ocel_event_id TEXT, ocel_object_id TEXT, ocel_qualifier TEXT);
+            CREATE TABLE object_object (ocel_source_id TEXT, ocel_target_id TEXT, ocel_qualifier TEXT);
+        ''')
+        if self.live:
+            self._index()
+
+    def event(self, eid, event):
+        activity = event[OCEL_ACT]
+        table = self._table('event', activity, ['ocel_time'] + self.attn)
+        vmap = event[OCEL_VMAP]
+        self._insert('event', (eid, activity))
+        self._insert(table, (eid, sql_value(event[OCEL_TIME])) + tuple(sql_value(vmap.get(k)) for k in self.attn))
+        for oid in event[OCEL_OMAP]:
+            self._insert('event_object', (eid, oid, None))
+
+    def object(self, oid, obj):
+        ovmap = obj[OCEL_OVMAP]
+        table = self._table('object', obj[OCEL_TYPE], ['ocel_time', 'ocel_changed_field'] + list(ovmap))
+        self._insert('object', (oid, obj[OCEL_TYPE]))
+        self._insert(table, (oid, '1970-01-01 00:00:00', None) + tuple(sql_value(v) for v in ovmap.values()))
+
+    def flush(self):
+        with self.connection:
+            for table, rows in self.rows.items():
+                marks = ', '.join('?' * len(rows[0]))
+                self.connection.executemany(f'INSERT INTO "{table}" VALUES ({marks})', rows)
+        self.rows = {}
+        self.pending = 0
+
+    def close(self):
+        self.flush()
+        self._index()
+        self.connection.close()
+
+    def _index(self):
+        statements = ['CREATE INDEX IF NOT EXISTS event_id ON event (ocel_id)',
+                      'CREATE INDEX IF NOT EXISTS object_id ON object (ocel_id)',
+                      'CREATE INDEX IF NOT EXISTS event_object_event ON event_object (ocel_event_id)',
+                      'CREATE INDEX IF NOT EXISTS event_object_object ON event_object (ocel_object_id)']
+        for table, _ in self.tables.values():
+            statements.append(f'CREATE INDEX IF NOT EXISTS "{table}_id" ON "{table}" (ocel_id)')
+        with self.connection:
+            for statement in statements:
+                self.connection.execute(statement)
+
+    def _table(self, kind, ocel_type, columns):
+        key = (kind, ocel_type)
+        if key not in self.tables:
+            type_map = re.sub(r'[^0-9A-Za-z]', '', str(ocel_type)) or kind
+            taken = {m for (k, t), (_, m) in self.tables.items() if k == kind}
+            suffix = type_map
+            n = 1
+            while suffix in taken:
+                n += 1
+                suffix = f"{type_map}{n}"
+            table = f"{kind}_{suffix}"
+            definition = ', '.join(f'"{c}"' for c in ['ocel_id'] + columns)
+            self.connection.execute(f'CREATE TABLE "{table}" ({definition})')
+            if self.live:
+                self.connection.execute(f'CREATE INDEX "{table}_id" ON "{table}" (ocel_id)')
+            self._insert(f'{kind}_map_type', (ocel_type, suffix))
+            self.tables[key] = (table, suffix)
+        return self.tables[key][0]
+
+    def _insert(self, table, row):
+        self.rows.setdefault(table, []).append(row)
+        self.pending += 1
+        if self.pending >= self.batch_size:
+            self.flush()
+
+
+def as_datetime(value):
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def text_value(value):
+    return value if value is None or isinstance(value, str) else json.dumps(value, default=json_serial)
+
+
+class ParquetOcelWriter:
+    """Writes events, objects and the event-object relation as Parquet tables into a directory, one row group per
+    batch"""
+
+    def __init__(self, directory, batch_size=100000):
+        import pyarrow
+        import pyarrow.parquet
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.batch_size = batch_size
+        self.rows = {'events': [], 'objects': [], 'relations': []}
+        self.writers = {}
+        self.schemas = {}
+
+    def begin(self, header):
+        pa = self.pa
+        time = pa.timestamp('us', tz='UTC')
+        self.attn = header[OCEL_GLOBAL][OCEL_ATTN]
+        self.schemas['events'] = pa.schema([('ocel:eid', pa.string()), (OCEL_ACT, pa.string()), (OCEL_TIME, time)] +
+                                           [(k, pa.string()) for k in self.attn])
+        self.schemas['objects'] = pa.schema([('ocel:oid', pa.string()), (OCEL_TYPE, pa.string()),
+                                             (OCEL_OVMAP, pa.string())])
+        self.schemas['relations'] = pa.schema([('ocel:eid', pa.string()), (OCEL_ACT, pa.string()), (OCEL_TIME, time),
+                                               ('ocel:oid', pa.string())])
+
+    def event(self, eid, event):
+        time = as_datetime(event[OCEL_TIME])
+        vmap = event[OCEL_VMAP]
+        self._append('events', [eid, event[OCEL_ACT], time] + [text_value(vmap.get(k)) for k in self.attn])
+        for oid in event[OCEL_OMAP]:
+            self._append('relations', [eid, event[OCEL_ACT], time, oid])
+
+    def object(self, oid, obj):
+        self._append('objects', [oid, obj[OCEL_TYPE], json.dumps(obj[OCEL_OVMAP], default=json_serial)])
+
+    def close(self):
+        for name in self.rows:
+            self._flush(name)
+            if name not in self.writers:
+                self.writers[name] = self.pq.ParquetWriter(os.path.join(self.directory, f"{name}.parquet"),
+                                                           self.schemas[name])
+            self.writers[name].close()
+
+    def _append(self, name, row):
+        self.rows[name].append(row)
+        if len(self.rows[name]) >= self.batch_size:
+            self._flush(name)
+
+    def _flush(self, name):
+        rows = self.rows[name]
+        if not rows:
+            return
+        schema = self.schemas[name]
+        columns = [self.pa.array(column, type=field.type) for column, field in zip(zip(*rows), schema)]
+        if name not in self.writers:
+            self.writers[name] = self.pq.ParquetWriter(os.path.join(self.directory, f"{name}.parquet"), schema)
+        self.writers[name].write_table(self.pa.Table.from_arrays(columns, schema=schema))
+        self.rows[name] = []
+
+
+class NdjsonOcelWriter:
+    """Writes a header line and then one JSON line per event and object, readable while it grows"""
+
+    def __init__(self, path):
+        self.file = sys.stdout.buffer if path == '-' else open(path, 'wb')
+        self.encode = json_encoder()
+
+    def begin(self, header):
+        self._line(header)
+
+    def event(self, eid, event):
+        self._line({OCEL_EID: eid, **event})
+
+    def object(self, oid, obj):
+        self._line({OCEL_OID: oid, **obj})
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        if self.file is sys.stdout.buffer:
+            self.file.flush()
+        else:
+            self.file.close()
+
+    def _line(self, value):
+        self.file.write(self.encode(value) + b'\n')
+
+
+def read_index(index_path):
+    """Indented index text, object types in order of appearance and the object type of each subprocess"""
+    with open(index_path) as f:
+        return parse_index(f.read())
+
+
+def parse_index(indented_text):
+    nodes = index_nodes(indented_text)
+    ots = list(dict.fromkeys(node.ot for node in nodes))
+    subprocesses = {node.oid: node.ot for node in nodes}
+    return indented_text, ots, subprocesses
+
+
+def index_nodes(indented_text, first_lineno=1):
+    """Nodes of the non-empty lines of an index, a line that is not 'type (uuid)' raises a ValueError"""
+    nodes = []
+    for lineno, line in enumerate(indented_text.splitlines(), first_lineno):
+        if line.strip():
+            try:
+                nodes.append(Node(line, lineno))
+            except IndexError:
+                raise ValueError(f"Line {lineno}: expected 'type (uuid)', got {line.strip()!r}") from None
+    return nodes
+
+
+def build_tree(indented_text):
+    """Subprocess tree of the index and the ingestion jobs of its nodes"""
+    root = Node(f"{ROOT}({str(uuid.uuid4())})")
+    jobs = []
+    root.add_children(index_nodes(indented_text), jobs)
+    return root, jobs
+
+
 # keyence_measure_dict = dict({'data_receiver': [{'name': 'message', 'mimetype': 'application/json', 'data': [{'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 15.32, 'timestamp': '2019-11-14T19:36:20.708+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 15.33, 'timestamp': '2019-11-14T19:36:20.719+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 15.34, 'timestamp': '2019-11-14T19:36:20.725+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 15.35, 'timestamp': '2019-11-14T19:36:20.735+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 15.36, 'timestamp': '2019-11-14T19:36:20.738+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 15.37, 'timestamp': '2019-11-14T19:36:20.742+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 15.38, 'timestamp': '2019-11-14T19:36:20.746+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 15.41, 'timestamp': '2019-11-14T19:36:20.756+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 15.43, 'timestamp': '2019-11-14T19:36:20.760+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 15.46, 'timestamp': '2019-11-14T19:36:20.764+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 15.51, 'timestamp': '2019-11-14T19:36:20.768+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 15.56, 'timestamp': '2019-11-14T19:36:20.771+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 15.62, 'timestamp': '2019-11-14T19:36:20.775+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 15.68, 'timestamp': '2019-11-14T19:36:20.778+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 15.73, 'timestamp': '2019-11-14T19:36:20.782+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 15.79, 'timestamp': '2019-11-14T19:36:20.785+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 15.85, 'timestamp': '2019-11-14T19:36:20.789+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 15.91, 'timestamp': '2019-11-14T19:36:20.793+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 15.98, 'timestamp': '2019-11-14T19:36:20.797+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 16.04, 'timestamp': '2019-11-14T19:36:20.800+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 16.1, 'timestamp': '2019-11-14T19:36:20.804+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 16.17, 'timestamp': '2019-11-14T19:36:20.807+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 16.23, 'timestamp': '2019-11-14T19:36:20.811+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 16.3, 'timestamp': '2019-11-14T19:36:20.815+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 16.37, 'timestamp': '2019-11-14T19:36:20.818+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 16.43, 'timestamp': '2019-11-14T19:36:20.822+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 16.5, 'timestamp': '2019-11-14T19:36:20.826+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 16.58, 'timestamp': '2019-11-14T19:36:20.829+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 16.65, 'timestamp': '2019-11-14T19:36:20.833+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 16.72, 'timestamp': '2019-11-14T19:36:20.836+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 16.8, 'timestamp': '2019-11-14T19:36:20.840+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 16.88, 'timestamp': '2019-11-14T19:36:20.844+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 16.95, 'timestamp': '2019-11-14T19:36:20.848+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 17.03, 'timestamp': '2019-11-14T19:36:20.851+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 17.11, 'timestamp': '2019-11-14T19:36:20.855+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 17.18, 'timestamp': '2019-11-14T19:36:20.858+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 17.25, 'timestamp': '2019-11-14T19:36:20.862+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 17.33, 'timestamp': '2019-11-14T19:36:20.865+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 17.4, 'timestamp': '2019-11-14T19:36:20.869+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 17.48, 'timestamp': '2019-11-14T19:36:20.873+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 17.55, 'timestamp': '2019-11-14T19:36:20.876+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 17.63, 'timestamp': '2019-11-14T19:36:20.880+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 17.71, 'timestamp': '2019-11-14T19:36:20.885+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 17.8, 'timestamp': '2019-11-14T19:36:20.889+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 17.86, 'timestamp': '2019-11-14T19:36:20.893+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 17.9, 'timestamp': '2019-11-14T19:36:20.897+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 17.94, 'timestamp': '2019-11-14T19:36:20.901+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 17.97, 'timestamp': '2019-11-14T19:36:20.905+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.0, 'timestamp': '2019-11-14T19:36:20.909+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.06, 'timestamp': '2019-11-14T19:36:20.917+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.1, 'timestamp': '2019-11-14T19:36:20.924+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.15, 'timestamp': '2019-11-14T19:36:20.928+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.18, 'timestamp': '2019-11-14T19:36:20.932+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.26, 'timestamp': '2019-11-14T19:36:20.945+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.3, 'timestamp': '2019-11-14T19:36:20.949+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.33, 'timestamp': '2019-11-14T19:36:20.953+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.35, 'timestamp': '2019-11-14T19:36:20.958+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.38, 'timestamp': '2019-11-14T19:36:20.962+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.4, 'timestamp': '2019-11-14T19:36:20.966+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.42, 'timestamp': '2019-11-14T19:36:20.970+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.44, 'timestamp': '2019-11-14T19:36:20.974+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.46, 'timestamp': '2019-11-14T19:36:20.978+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.47, 'timestamp': '2019-11-14T19:36:20.982+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.49, 'timestamp': '2019-11-14T19:36:20.985+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.51, 'timestamp': '2019-11-14T19:36:20.989+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.52, 'timestamp': '2019-11-14T19:36:20.993+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.54, 'timestamp': '2019-11-14T19:36:20.997+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.56, 'timestamp': '2019-11-14T19:36:21.001+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.57, 'timestamp': '2019-11-14T19:36:21.004+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.59, 'timestamp': '2019-11-14T19:36:21.009+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.6, 'timestamp': '2019-11-14T19:36:21.013+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.61, 'timestamp': '2019-11-14T19:36:21.018+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.63, 'timestamp': '2019-11-14T19:36:21.022+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.64, 'timestamp': '2019-11-14T19:36:21.025+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.65, 'timestamp': '2019-11-14T19:36:21.029+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.66, 'timestamp': '2019-11-14T19:36:21.032+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.67, 'timestamp': '2019-11-14T19:36:21.038+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.68, 'timestamp': '2019-11-14T19:36:21.041+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.69, 'timestamp': '2019-11-14T19:36:21.044+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.7, 'timestamp': '2019-11-14T19:36:21.047+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.71, 'timestamp': '2019-11-14T19:36:21.053+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.72, 'timestamp': '2019-11-14T19:36:21.056+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.73, 'timestamp': '2019-11-14T19:36:21.060+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.74, 'timestamp': '2019-11-14T19:36:21.066+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.75, 'timestamp': '2019-11-14T19:36:21.069+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.76, 'timestamp': '2019-11-14T19:36:21.075+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.77, 'timestamp': '2019-11-14T19:36:21.078+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.78, 'timestamp': '2019-11-14T19:36:21.084+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.79, 'timestamp': '2019-11-14T19:36:21.089+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.8, 'timestamp': '2019-11-14T19:36:21.093+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.81, 'timestamp': '2019-11-14T19:36:21.098+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.82, 'timestamp': '2019-11-14T19:36:21.102+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.83, 'timestamp': '2019-11-14T19:36:21.107+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.84, 'timestamp': '2019-11-14T19:36:21.113+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.85, 'timestamp': '2019-11-14T19:36:21.119+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.87, 'timestamp': '2019-11-14T19:36:21.129+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.88, 'timestamp': '2019-11-14T19:36:21.134+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.89, 'timestamp': '2019-11-14T19:36:21.140+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.9, 'timestamp': '2019-11-14T19:36:21.146+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.91, 'timestamp': '2019-11-14T19:36:21.151+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.92, 'timestamp': '2019-11-14T19:36:21.157+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.93, 'timestamp': '2019-11-14T19:36:21.163+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.94, 'timestamp': '2019-11-14T19:36:21.168+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.95, 'timestamp': '2019-11-14T19:36:21.177+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.96, 'timestamp': '2019-11-14T19:36:21.183+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.97, 'timestamp': '2019-11-14T19:36:21.188+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.98, 'timestamp': '2019-11-14T19:36:21.197+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.99, 'timestamp': '2019-11-14T19:36:21.203+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.0, 'timestamp': '2019-11-14T19:36:21.212+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.01, 'timestamp': '2019-11-14T19:36:21.220+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.02, 'timestamp': '2019-11-14T19:36:21.228+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.03, 'timestamp': '2019-11-14T19:36:21.236+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.04, 'timestamp': '2019-11-14T19:36:21.245+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.05, 'timestamp': '2019-11-14T19:36:21.255+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.06, 'timestamp': '2019-11-14T19:36:21.264+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.07, 'timestamp': '2019-11-14T19:36:21.275+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.08, 'timestamp': '2019-11-14T19:36:21.286+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.09, 'timestamp': '2019-11-14T19:36:21.297+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.1, 'timestamp': '2019-11-14T19:36:21.311+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.11, 'timestamp': '2019-11-14T19:36:21.335+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.12, 'timestamp': '2019-11-14T19:36:21.344+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.13, 'timestamp': '2019-11-14T19:36:21.363+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.14, 'timestamp': '2019-11-14T19:36:21.384+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.15, 'timestamp': '2019-11-14T19:36:21.411+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.16, 'timestamp': '2019-11-14T19:36:21.446+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.17, 'timestamp': '2019-11-14T19:36:21.499+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.16, 'timestamp': '2019-11-14T19:36:22.113+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.15, 'timestamp': '2019-11-14T19:36:22.170+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.14, 'timestamp': '2019-11-14T19:36:22.206+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.13, 'timestamp': '2019-11-14T19:36:22.230+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.12, 'timestamp': '2019-11-14T19:36:22.253+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.11, 'timestamp': '2019-11-14T19:36:22.273+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.1, 'timestamp': '2019-11-14T19:36:22.285+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.09, 'timestamp': '2019-11-14T19:36:22.297+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.08, 'timestamp': '2019-11-14T19:36:22.310+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.07, 'timestamp': '2019-11-14T19:36:22.322+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.06, 'timestamp': '2019-11-14T19:36:22.334+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.05, 'timestamp': '2019-11-14T19:36:22.343+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.04, 'timestamp': '2019-11-14T19:36:22.353+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.03, 'timestamp': '2019-11-14T19:36:22.362+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.02, 'timestamp': '2019-11-14T19:36:22.371+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.01, 'timestamp': '2019-11-14T19:36:22.380+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 19.0, 'timestamp': '2019-11-14T19:36:22.387+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.99, 'timestamp': '2019-11-14T19:36:22.394+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.98, 'timestamp': '2019-11-14T19:36:22.400+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.97, 'timestamp': '2019-11-14T19:36:22.407+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.96, 'timestamp': '2019-11-14T19:36:22.413+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.95, 'timestamp': '2019-11-14T19:36:22.420+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.94, 'timestamp': '2019-11-14T19:36:22.426+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.93, 'timestamp': '2019-11-14T19:36:22.430+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.92, 'timestamp': '2019-11-14T19:36:22.437+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.91, 'timestamp': '2019-11-14T19:36:22.444+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.9, 'timestamp': '2019-11-14T19:36:22.447+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.88, 'timestamp': '2019-11-14T19:36:22.460+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.87, 'timestamp': '2019-11-14T19:36:22.467+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.86, 'timestamp': '2019-11-14T19:36:22.471+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.85, 'timestamp': '2019-11-14T19:36:22.477+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.84, 'timestamp': '2019-11-14T19:36:22.481+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.83, 'timestamp': '2019-11-14T19:36:22.485+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.82, 'timestamp': '2019-11-14T19:36:22.489+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.81, 'timestamp': '2019-11-14T19:36:22.493+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.79, 'timestamp': '2019-11-14T19:36:22.496+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.78, 'timestamp': '2019-11-14T19:36:22.500+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.77, 'timestamp': '2019-11-14T19:36:22.504+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.75, 'timestamp': '2019-11-14T19:36:22.508+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.74, 'timestamp': '2019-11-14T19:36:22.512+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.73, 'timestamp': '2019-11-14T19:36:22.516+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.71, 'timestamp': '2019-11-14T19:36:22.519+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.7, 'timestamp': '2019-11-14T19:36:22.523+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.68, 'timestamp': '2019-11-14T19:36:22.527+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.67, 'timestamp': '2019-11-14T19:36:22.531+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.66, 'timestamp': '2019-11-14T19:36:22.535+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.64, 'timestamp': '2019-11-14T19:36:22.538+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.63, 'timestamp': '2019-11-14T19:36:22.542+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.61, 'timestamp': '2019-11-14T19:36:22.546+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.6, 'timestamp': '2019-11-14T19:36:22.552+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.58, 'timestamp': '2019-11-14T19:36:22.556+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.56, 'timestamp': '2019-11-14T19:36:22.560+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.55, 'timestamp': '2019-11-14T19:36:22.564+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.53, 'timestamp': '2019-11-14T19:36:22.568+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.52, 'timestamp': '2019-11-14T19:36:22.572+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.5, 'timestamp': '2019-11-14T19:36:22.576+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.49, 'timestamp': '2019-11-14T19:36:22.579+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.47, 'timestamp': '2019-11-14T19:36:22.583+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.45, 'timestamp': '2019-11-14T19:36:22.587+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.44, 'timestamp': '2019-11-14T19:36:22.591+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.43, 'timestamp': '2019-11-14T19:36:22.595+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.41, 'timestamp': '2019-11-14T19:36:22.598+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.4, 'timestamp': '2019-11-14T19:36:22.602+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.38, 'timestamp': '2019-11-14T19:36:22.606+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.37, 'timestamp': '2019-11-14T19:36:22.610+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.36, 'timestamp': '2019-11-14T19:36:22.615+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.34, 'timestamp': '2019-11-14T19:36:22.619+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.33, 'timestamp': '2019-11-14T19:36:22.623+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 18.31, 'timestamp': '2019-11-14T19:36:22.626+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 999.99, 'timestamp': '2019-11-14T19:36:22.630+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.47, 'timestamp': '2019-11-14T19:36:23.212+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.48, 'timestamp': '2019-11-14T19:36:23.295+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.47, 'timestamp': '2019-11-14T19:36:23.449+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.46, 'timestamp': '2019-11-14T19:36:23.520+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.45, 'timestamp': '2019-11-14T19:36:23.562+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.44, 'timestamp': '2019-11-14T19:36:23.599+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.43, 'timestamp': '2019-11-14T19:36:23.628+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.42, 'timestamp': '2019-11-14T19:36:23.656+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.41, 'timestamp': '2019-11-14T19:36:23.682+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.4, 'timestamp': '2019-11-14T19:36:23.705+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.39, 'timestamp': '2019-11-14T19:36:23.725+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.38, 'timestamp': '2019-11-14T19:36:23.745+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.37, 'timestamp': '2019-11-14T19:36:23.765+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.36, 'timestamp': '2019-11-14T19:36:23.783+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.35, 'timestamp': '2019-11-14T19:36:23.800+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.34, 'timestamp': '2019-11-14T19:36:23.818+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.33, 'timestamp': '2019-11-14T19:36:23.833+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.32, 'timestamp': '2019-11-14T19:36:23.848+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.31, 'timestamp': '2019-11-14T19:36:23.863+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.3, 'timestamp': '2019-11-14T19:36:23.878+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.29, 'timestamp': '2019-11-14T19:36:23.893+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.28, 'timestamp': '2019-11-14T19:36:23.907+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.27, 'timestamp': '2019-11-14T19:36:23.919+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.26, 'timestamp': '2019-11-14T19:36:23.931+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.25, 'timestamp': '2019-11-14T19:36:23.942+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.24, 'timestamp': '2019-11-14T19:36:23.955+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.23, 'timestamp': '2019-11-14T19:36:23.967+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.22, 'timestamp': '2019-11-14T19:36:23.980+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.21, 'timestamp': '2019-11-14T19:36:23.992+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.2, 'timestamp': '2019-11-14T19:36:24.001+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.19, 'timestamp': '2019-11-14T19:36:24.014+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.18, 'timestamp': '2019-11-14T19:36:24.023+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.17, 'timestamp': '2019-11-14T19:36:24.032+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.16, 'timestamp': '2019-11-14T19:36:24.044+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.15, 'timestamp': '2019-11-14T19:36:24.051+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.14, 'timestamp': '2019-11-14T19:36:24.064+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.13, 'timestamp': '2019-11-14T19:36:24.075+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.12, 'timestamp': '2019-11-14T19:36:24.080+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.11, 'timestamp': '2019-11-14T19:36:24.087+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.1, 'timestamp': '2019-11-14T19:36:24.093+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.09, 'timestamp': '2019-11-14T19:36:24.102+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.08, 'timestamp': '2019-11-14T19:36:24.111+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.07, 'timestamp': '2019-11-14T19:36:24.120+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.06, 'timestamp': '2019-11-14T19:36:24.127+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.05, 'timestamp': '2019-11-14T19:36:24.133+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.04, 'timestamp': '2019-11-14T19:36:24.143+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.03, 'timestamp': '2019-11-14T19:36:24.149+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 8.01, 'timestamp': '2019-11-14T19:36:24.155+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.97, 'timestamp': '2019-11-14T19:36:24.159+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.92, 'timestamp': '2019-11-14T19:36:24.162+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.87, 'timestamp': '2019-11-14T19:36:24.166+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.82, 'timestamp': '2019-11-14T19:36:24.170+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.76, 'timestamp': '2019-11-14T19:36:24.174+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.71, 'timestamp': '2019-11-14T19:36:24.178+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.68, 'timestamp': '2019-11-14T19:36:24.181+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.67, 'timestamp': '2019-11-14T19:36:24.185+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.66, 'timestamp': '2019-11-14T19:36:24.188+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.65, 'timestamp': '2019-11-14T19:36:24.192+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.64, 'timestamp': '2019-11-14T19:36:24.198+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.63, 'timestamp': '2019-11-14T19:36:24.204+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.62, 'timestamp': '2019-11-14T19:36:24.213+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.61, 'timestamp': '2019-11-14T19:36:24.220+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.6, 'timestamp': '2019-11-14T19:36:24.226+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.59, 'timestamp': '2019-11-14T19:36:24.232+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.58, 'timestamp': '2019-11-14T19:36:24.241+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.57, 'timestamp': '2019-11-14T19:36:24.248+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.56, 'timestamp': '2019-11-14T19:36:24.254+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.55, 'timestamp': '2019-11-14T19:36:24.263+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.53, 'timestamp': '2019-11-14T19:36:24.267+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.51, 'timestamp': '2019-11-14T19:36:24.271+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.49, 'timestamp': '2019-11-14T19:36:24.275+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.48, 'timestamp': '2019-11-14T19:36:24.278+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.49, 'timestamp': '2019-11-14T19:36:24.285+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.52, 'timestamp': '2019-11-14T19:36:24.288+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.56, 'timestamp': '2019-11-14T19:36:24.292+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.61, 'timestamp': '2019-11-14T19:36:24.296+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.65, 'timestamp': '2019-11-14T19:36:24.300+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.68, 'timestamp': '2019-11-14T19:36:24.304+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.72, 'timestamp': '2019-11-14T19:36:24.308+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.73, 'timestamp': '2019-11-14T19:36:24.311+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.72, 'timestamp': '2019-11-14T19:36:24.318+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.71, 'timestamp': '2019-11-14T19:36:24.324+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.7, 'timestamp': '2019-11-14T19:36:24.328+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.69, 'timestamp': '2019-11-14T19:36:24.332+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.68, 'timestamp': '2019-11-14T19:36:24.338+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.67, 'timestamp': '2019-11-14T19:36:24.342+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.66, 'timestamp': '2019-11-14T19:36:24.346+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.65, 'timestamp': '2019-11-14T19:36:24.352+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.64, 'timestamp': '2019-11-14T19:36:24.356+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.63, 'timestamp': '2019-11-14T19:36:24.359+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.62, 'timestamp': '2019-11-14T19:36:24.363+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.61, 'timestamp': '2019-11-14T19:36:24.367+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.6, 'timestamp': '2019-11-14T19:36:24.371+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.59, 'timestamp': '2019-11-14T19:36:24.377+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.58, 'timestamp': '2019-11-14T19:36:24.381+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.57, 'timestamp': '2019-11-14T19:36:24.385+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.56, 'timestamp': '2019-11-14T19:36:24.392+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.57, 'timestamp': '2019-11-14T19:36:24.401+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.56, 'timestamp': '2019-11-14T19:36:24.411+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.55, 'timestamp': '2019-11-14T19:36:24.415+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.54, 'timestamp': '2019-11-14T19:36:24.419+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.53, 'timestamp': '2019-11-14T19:36:24.423+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.52, 'timestamp': '2019-11-14T19:36:24.427+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.51, 'timestamp': '2019-11-14T19:36:24.434+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.5, 'timestamp': '2019-11-14T19:36:24.438+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.49, 'timestamp': '2019-11-14T19:36:24.442+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.48, 'timestamp': '2019-11-14T19:36:24.446+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.47, 'timestamp': '2019-11-14T19:36:24.450+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.46, 'timestamp': '2019-11-14T19:36:24.454+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.45, 'timestamp': '2019-11-14T19:36:24.459+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.44, 'timestamp': '2019-11-14T19:36:24.467+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.42, 'timestamp': '2019-11-14T19:36:24.471+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.41, 'timestamp': '2019-11-14T19:36:24.478+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.4, 'timestamp': '2019-11-14T19:36:24.482+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.39, 'timestamp': '2019-11-14T19:36:24.487+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.38, 'timestamp': '2019-11-14T19:36:24.493+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.37, 'timestamp': '2019-11-14T19:36:24.497+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.36, 'timestamp': '2019-11-14T19:36:24.501+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.35, 'timestamp': '2019-11-14T19:36:24.505+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.34, 'timestamp': '2019-11-14T19:36:24.509+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.33, 'timestamp': '2019-11-14T19:36:24.513+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.32, 'timestamp': '2019-11-14T19:36:24.520+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.31, 'timestamp': '2019-11-14T19:36:24.524+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.3, 'timestamp': '2019-11-14T19:36:24.528+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.29, 'timestamp': '2019-11-14T19:36:24.532+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.28, 'timestamp': '2019-11-14T19:36:24.536+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.27, 'timestamp': '2019-11-14T19:36:24.540+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.26, 'timestamp': '2019-11-14T19:36:24.544+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.25, 'timestamp': '2019-11-14T19:36:24.548+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.24, 'timestamp': '2019-11-14T19:36:24.552+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.23, 'timestamp': '2019-11-14T19:36:24.556+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.22, 'timestamp': '2019-11-14T19:36:24.560+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.21, 'timestamp': '2019-11-14T19:36:24.564+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.2, 'timestamp': '2019-11-14T19:36:24.568+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.19, 'timestamp': '2019-11-14T19:36:24.572+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.18, 'timestamp': '2019-11-14T19:36:24.576+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.17, 'timestamp': '2019-11-14T19:36:24.580+01:00', 'meta': {}}, {'ID': 'keyence/measurement', 'source': 'keyence', 'name': 'measurement', 'description': '', 'path': 'measurement', 'value': 7.16, 'timestamp': '2019-11-14T19:36:24.584+01:00', 'meta': {}}]}]})
 # microvu_measure_dict = dict({'data_changer': ['qc2', 'qc2_success'], 'data_values': {'qr': '*268MFA466*TZHZE 035', 'qc2': {'Zylinder Ø4,5-B': {'Durchmesser': {'status': 'ok', 'on_scale_from_zero_to_one': 0.6166666666666863}, 'Zylinderform': {'status': 'nok', 'on_scale_from_zero_to_one': 1.16}, 'Rechtwinkligkeit': {'status': 'ok', 'on_scale_from_zero_to_one': 0.4}}, 'Kreis Ø19,2-1': {'Mitte Z': {'status': 'ok', 'on_scale_from_zero_to_one': 0.8620000000000014}, 'Durchmesser': {'status': 'ok', 'on_scale_from_zero_to_one': 0.48999999999998795}}, 'Kreis Ø19,2-2': {'Mitte Z': {'status': 'ok', 'on_scale_from_zero_to_one': 0.8690000000000012}, 'Durchmesser': {'status': 'ok', 'on_scale_from_zero_to_one': 0.41200000000002873}}, 'Zylinder 19,2-CZ': {}, 'Distanz Z9,3': {'Distanz Z': {'status': 'ok', 'on_scale_from_zero_to_one': 0.6039999999999978}}, 'Distanz Z4,8': {'Distanz Z': {'status': 'ok', 'on_scale_from_zero_to_one': 0.47500000000000486}}}, 'qc2_success': False}, 'data_received': None})
 
-result = {}
-ocel_json = {}
 
-concepts = list(set(log_final[CONCEPT_NAME]))
+EVENT_ATTRIBUTES = [DATA, CONCEPT_ENDPOINT, CONCEPT_INSTANCE, ID, CPEEID, CPEE_ACT_ID, LIFECYCLE, CPEE_LIFECYCLE,
+                    SUB_ROOT]
 
-# No Datastream in data objects
-# {k: v for k,v in data[DATA].items() if str(v).find("point") != -1}
 
-components_from_dataid = {
-    k: {
-        XES_DATASTREAM_NAME: v[0][XES_DATASTREAM_NAME] if XES_DATASTREAM_NAME in v[0] else NA,
-        XES_DATASTREAM_SOURCE: v[1][XES_DATASTREAM_SOURCE] if len(v) > 1 and XES_DATASTREAM_SOURCE in v[1] else NA
-    } for k, v in data[DATASTREAM].items()}
+def ocel_event(log, i, omap):
+    return {
+        OCEL_ACT: f"{log[CONCEPT_NAME][i]}{LC_DELIMITER}{log[CPEE_LIFECYCLE][i]}",
+        OCEL_TIME: log[TIME][i],
+        OCEL_OMAP: omap,
+        OCEL_VMAP: {
+            k: log[k][i]
+            for k in EVENT_ATTRIBUTES
+            # Only attributes that contain a value
+            if log[k][i] != DUMMY and log[k][i] != NA
+        }
+    }
 
-components = {
-    v[0][XES_DATASTREAM_NAME]: v[1][XES_DATASTREAM_SOURCE]
-    for k, v in data[DATASTREAM].items() if XES_DATASTREAM_NAME in v[0]}
 
-components[NA] = None
+def ocel_components(data):
+    """Object id of every component named by a datastream and of the NA component"""
+    components = {
+        v[0][XES_DATASTREAM_NAME]: v[1][XES_DATASTREAM_SOURCE]
+        for k, v in data[DATASTREAM].items() if XES_DATASTREAM_NAME in v[0]}
 
-components_uids = {
-    k: str(uuid.uuid4()) for k in components.keys()
-}
+    components[NA] = None
+
+    return {
+        k: str(uuid.uuid4()) for k in components.keys()
+    }
 
-all_lifecycles = [f"{NAMESPACE_LIFECYCLE}:{i}" for i in concepts]
-all_sub = [f"{NAMESPACE_SUBPROCESS}:{i}" for i in ots]
-all_comp = [f"{NAMESPACE_DEVICES}:{i}" for i in components_uids.keys()]
-all_ots = [DATA, DATASTREAM] + all_lifecycles + all_sub + all_comp
 
-attn = [DATA, CONCEPT_ENDPOINT, CONCEPT_INSTANCE, ID, CPEEID, CPEE_ACT_ID, LIFECYCLE, CPEE_LIFECYCLE, SUB_ROOT]
+def ocel_header(concepts, ots, components_uids):
+    all_lifecycles = [f"{NAMESPACE_LIFECYCLE}:{i}" for i in concepts]
+    all_sub = [f"{NAMESPACE_SUBPROCESS}:{i}" for i in ots]
+    all_comp = [f"{NAMESPACE_DEVICES}:{i}" for i in components_uids.keys()]
+    all_ots = [DATA, DATASTREAM] + all_lifecycles + all_sub + all_comp
 
-ocel_json[OCEL_GLOBAL] = {"ocel:version": "0.1",
+    return {OCEL_GLOBAL: {"ocel:version": "0.1",
                           "ocel:ordering": "timestamp",
-                          "ocel:attribute-names": attn,
-                          "ocel:object-types": all_ots}
-ocel_json[OCEL_GE] = {OCEL_ACT: OCEL_NA}
-ocel_json[OCEL_GO] = {OCEL_TYPE: OCEL_NA}
-
-# Add all keys to data
-for id in log_final[CPEE_ACT_ID]:
-    if id not in data[DATASTREAM_TO][CPEE_ACT_ID]:
-        data[DATASTREAM_TO][CPEE_ACT_ID][id] = []
-
-lifecycle_counts = {k: log_final[CPEE_ACT_ID].count(k) for k in set(log_final[CPEE_ACT_ID])}
-
-no_lifecycles_all = {k: 0 for k, v in lifecycle_counts.items() if v == 1}
-no_lifecycles_real = {}
-for k in no_lifecycles_all:
-    activities = [act for act, ids in data[ACTIVITY_TO_INSTANCE].items() if k in ids]
-    act = activities[0]
-    no_lifecycles_all[k] = act
-    another = 0
-    for aid in data[ACTIVITY_TO_INSTANCE][act]:
-        if data[ACTIVITY_TO_INSTANCE][act][aid] > 1:
-            another = 1
-    if another == 0:
-        no_lifecycles_real[k] = act
-
-def extract_component_from_endpoint(endpoint):
-    for k in components_uids.keys():
-        if k in endpoint:
-            return components_uids[k]
-    return components_uids[NA]
-
-ocel_json[OCEL_EVENTS] = {
-    str(uuid.uuid4()): {
-        OCEL_ACT: f"{log_final[CONCEPT_NAME][i]}{LC_DELIMITER}{log_final[CPEE_LIFECYCLE][i]}",
-        OCEL_TIME: log_final[TIME][i],
-        OCEL_OMAP: [log_final[k][i] for k in list(ots) if log_final[k][i] != ""] + [
-            # Lifecycle
-            log_final[CPEE_ACT_ID][i]  # if lifecycle_counts[log_final[CPEE_ACT_ID][i]] > 0 else 0
+                          "ocel:attribute-names": EVENT_ATTRIBUTES,
+                          "ocel:object-types": all_ots},
+            OCEL_GE: {OCEL_ACT: OCEL_NA},
+            OCEL_GO: {OCEL_TYPE: OCEL_NA}}
+
+
+def build_ocel(log_final, data, ots, subprocesses):
+    """OCEL header together with generators of the events and objects of an ingested log"""
+    concepts = list(log_final[CONCEPT_NAME].values)
+
+    # No Datastream in data objects
+    # {k: v for k,v in data[DATA].items() if str(v).find("point") != -1}
+
+    components_uids = ocel_components(data)
+
+    ocel_json = ocel_header(concepts, ots, components_uids)
+
+    index = LogIndex(log_final, data)
+
+    # Add all keys to data
+    for id in index.counts:
+        if id not in data[DATASTREAM_TO][CPEE_ACT_ID]:
+            data[DATASTREAM_TO][CPEE_ACT_ID][id] = []
+
+    component_matcher = ComponentMatcher({k: v for k, v in components_uids.items() if k != NA}, components_uids[NA])
+
+    def extract_component_from_endpoint(endpoint):
+        return component_matcher.match(endpoint)
+
+    def build_event(i):
+        aid = log_final[CPEE_ACT_ID][i]
+        return ocel_event(log_final, i, log_final.omap(i) + (
+            # Lifecycle, no dummy object identifier for activity having no lifecycle
+            [] if aid in index.no_lifecycles and aid != DUMMY and aid != NA else [aid]
             # Components
-        ] + [extract_component_from_endpoint(log_final[CONCEPT_ENDPOINT][i])],
+        ) + [extract_component_from_endpoint(log_final[CONCEPT_ENDPOINT][i])])
         #list({components_uids[components_from_dataid[dataid][XES_DATASTREAM_NAME]]
             #      for dataid in data[DATASTREAM_TO][CPEE_ACT_ID][log_final[CPEE_ACT_ID][i]]}),
-        OCEL_VMAP: {
-            k: log_final[k][i]
-            for k in attn
-            # Only attributes that contain a value
-            if log_final[k][i] != DUMMY and log_final[k][i] != NA
-        }
-    }
-    for i in range(len(log_final[CONCEPT_NAME]))
-}
-
-# Remove dummy 0 object identifier for activity having no lifecycle
-event_ids = [(k, v[OCEL_VMAP][CPEE_ACT_ID]) for k, v in ocel_json[OCEL_EVENTS].items() if
-             v[OCEL_VMAP][CPEE_ACT_ID] in no_lifecycles_real]
-for eid, aid in event_ids:
-    ocel_json[OCEL_EVENTS][eid][OCEL_OMAP].remove(aid)
-
-# Ids for data + for lifecycles + for subprocesses
-all_oids = list(data.keys()) + list(set(log_final[CPEE_ACT_ID])) + list(subprocesses.keys())
-
-data_objects = {
-    k: {
-        OCEL_TYPE: DATA,
-        OCEL_OVMAP: {DICT_TO_LIST: data[DATA][k]}
-    }
-    for k in data[DATA].keys()
-}
 
-datastream_objects = {
-    k: {
-        OCEL_TYPE: DATASTREAM,
-        OCEL_OVMAP: {DICT_TO_LIST: data[DATASTREAM][k]}
-    }
-    for k in data[DATASTREAM].keys()
-}
+    ocel_events = ((str(uuid.uuid4()), build_event(i)) for i in range(len(log_final)))
 
-lifecycle_objects = {
-    k: {
-        OCEL_TYPE: f"{NAMESPACE_LIFECYCLE}:{log_final[CONCEPT_NAME][i]}",
-        OCEL_OVMAP: {}
-    }
-    for k, i in zip(log_final[CPEE_ACT_ID], range(len(log_final[CPEE_ACT_ID])))
-    if k not in no_lifecycles_real
-}
-
-subprocess_objects = {
-    k: {
-        OCEL_TYPE: f"{NAMESPACE_SUBPROCESS}:{v}",
-        OCEL_OVMAP: {}
-    }
-    for k, v in subprocesses.items()
-}
+    data_objects = (
+        (k, {
+            OCEL_TYPE: DATA,
+            OCEL_OVMAP: {DICT_TO_LIST: data[DATA][k]}
+        })
+        for k in data[DATA].keys()
+    )
 
-component_objects = {
-    v: {
-        OCEL_TYPE: f"{NAMESPACE_DEVICES}:{k}",
-        OCEL_OVMAP: {}
-    }
-    for k, v in components_uids.items()
-}
+    datastream_objects = (
+        (k, {
+            OCEL_TYPE: DATASTREAM,
+            OCEL_OVMAP: {DICT_TO_LIST: data[DATASTREAM][k]}
+        })
+        for k in data[DATASTREAM].keys()
+    )
+
+    lifecycle_objects = (
+        (k, {
+            OCEL_TYPE: f"{NAMESPACE_LIFECYCLE}:{v}",
+            OCEL_OVMAP: {}
+        })
+        for k, v in index.lifecycle_types.items()
+        if k not in index.no_lifecycles
+    )
+
+    subprocess_objects = (
+        (k, {
+            OCEL_TYPE: f"{NAMESPACE_SUBPROCESS}:{v}",
+            OCEL_OVMAP: {}
+        })
+        for k, v in subprocesses.items()
+    )
+
+    component_objects = (
+        (v, {
+            OCEL_TYPE: f"{NAMESPACE_DEVICES}:{k}",
+            OCEL_OVMAP: {}
+        })
+        for k, v in components_uids.items()
+    )
+
+    ocel_objects = chain(data_objects, datastream_objects, lifecycle_objects, subprocess_objects, component_objects)
+
+    return ocel_json, ocel_events, ocel_objects
+
+
+def write_ocel(writers, header, events, objects):
+    """Feed the events and objects to every writer as they are generated, so all outputs share the same ids"""
+    n_events = n_objects = 0
+    for writer in writers:
+        writer.begin(header)
+    for eid, event in events:
+        for writer in writers:
+            writer.event(eid, event)
+        n_events += 1
+    for oid, obj in objects:
+        for writer in writers:
+            writer.object(oid, obj)
+        n_objects += 1
+    for writer in writers:
+        writer.close()
+    return n_events, n_objects
+
+
+def convert(index_path, trace_dir=None, output=None, workers=1, indent=2, cache_dir=None, cache_limit=CACHE_LIMIT,
+            sqlite=None, parquet=None, dedup=False, report=None, progress=False, profile=None, profiler=None):
+    """Convert the CPEE traces listed in an index.txt to OCEL JSON.
+
+    Traces are read from trace_dir and the log is written to output, both default to the directory of the index.
+    The same events and objects additionally go to an OCEL 2.0 style SQLite database and a directory of Parquet
+    tables if their paths are given. With dedup identical data and datastream payloads become a single object.
+    Returns the number of events and objects written, the subprocesses whose trace could not be read and how many
+    payloads and bytes deduplication saved, the number of malformed subprocess receive payloads and of events skipped
+    for lacking a timestamp.
+
+    If report is a path, the time and peak memory of each phase (tree, ingest, build, write) and the parse time and
+    events of each trace are written there as JSON. progress shows the ingestion progress on stderr and profile
+    names a phase to run under profiler, by default cProfile writing its stats next to the output.
+    """
+    index_dir = os.path.dirname(index_path)
+    trace_dir = index_dir if trace_dir is None else trace_dir
+    output = os.path.join(index_dir, 'out.jsonocel') if output is None else output
+    if profile is not None and profiler is None:
+        profiler = lambda phase: cprofile_phase(f"{output}.{phase}.prof")
+    run = RunReport(progress, profile, profiler)
+    with run.phase('tree'):
+        indented_text, ots, subprocesses = read_index(index_path)
+        root, jobs = build_tree(indented_text)
+    writers = [JsonOcelWriter(output, indent=indent)]
+    if sqlite is not None:
+        writers.append(SqliteOcelWriter(sqlite))
+    if parquet is not None:
+        writers.append(ParquetOcelWriter(parquet))
+    log_final = EventLog()
+    data = new_data()
+    fail = []
+    cache = TraceCache(cache_dir, cache_limit, trace_dir, dedup) if cache_dir is not None else None
+    run.expect(len(jobs))
+    with run.phase('ingest'):
+        ingest(jobs, log_final, data, subprocesses, fail, workers, cache, trace_dir, dedup, run)
+    with run.phase('build'):
+        header, events, objects = build_ocel(log_final, data, ots, subprocesses)
+    # Events and objects are generated lazily, so this includes building them
+    with run.phase('write'):
+        n_events, n_objects = write_ocel(writers, header, events, objects)
+    result = {'events': n_events, 'objects': n_objects, 'fail': fail, **data[STATS]}
+    if report is not None:
+        run.write(report, result)
+    return result
+
+
+def build_pm4py(log_final, data, ots, subprocesses):
+    """pm4py OCEL of an ingested log, equal to reading back the OCEL JSON written for it.
+
+    The events, objects and relations dataframes are built column by column from the dictionary-encoded event store,
+    only distinct values are handled in Python.
+    """
+    import numpy as np
+    import pandas as pd
+    from pm4py.objects.ocel.obj import OCEL
+    from pm4py.objects.ocel.util import ocel_consistency, filtering_utils
+
+    components_uids = ocel_components(data)
+    header = ocel_header(log_final[CONCEPT_NAME].values, ots, components_uids)
+    index = LogIndex(log_final, data)
+    component_matcher = ComponentMatcher({k: v for k, v in components_uids.items() if k != NA}, components_uids[NA])
+    n = len(log_final)
+
+    def codes(column):
+        return np.asarray(column.codes, dtype=np.intp)
+
+    def values(column, convert=lambda v: v):
+        return np.array([convert(v) for v in column.values] + [None], dtype=object)[:-1]
+
+    def attribute(column):
+        # Empty values are left out of the vmap, so they become missing values as in the OCEL JSON import
+        if isinstance(column, Column):
+            distinct = pd.Series([None if v == DUMMY or v == NA else v for v in column.values])
+            return distinct.take(codes(column)).reset_index(drop=True)
+        return pd.Series([None if v == DUMMY or v == NA else v for v in column])
+
+    eids = np.array([str(uuid.uuid4()) for _ in range(n)], dtype=object)
+    names, lifecycles = log_final[CONCEPT_NAME], log_final[CPEE_LIFECYCLE]
+    pairs = codes(names) * len(lifecycles.values) + codes(lifecycles)
+    distinct, inverse = np.unique(pairs, return_inverse=True)
+    activities = np.array([f"{names.values[p // len(lifecycles.values)]}{LC_DELIMITER}"
+                           f"{lifecycles.values[p % len(lifecycles.values)]}" for p in distinct] + [None],
+                          dtype=object)[:-1][inverse]
+    timestamps = pd.to_datetime(pd.Series(log_final[TIME], dtype=object), utc=True)
+    events = pd.DataFrame({OCEL_EID: eids, OCEL_TIME: timestamps, OCEL_ACT: activities})
+    for k in EVENT_ATTRIBUTES:
+        events[k] = attribute(log_final[k])
+    # Attributes without any value never occur in a vmap
+    events = events.drop(columns=[k for k in EVENT_ATTRIBUTES if events[k].isna().all()])
+
+    oids, types, payloads = [], [], []
+    for kind in (DATA, DATASTREAM):
+        oids.extend(data[kind])
+        types.extend([kind] * len(data[kind]))
+        payloads.extend(data[kind].values())
+    lifecycle_oids = [k for k in index.lifecycle_types if k not in index.no_lifecycles]
+    oids.extend(lifecycle_oids)
+    types.extend(f"{NAMESPACE_LIFECYCLE}:{index.lifecycle_types[k]}" for k in lifecycle_oids)
+    oids.extend(subprocesses)
+    types.extend(f"{NAMESPACE_SUBPROCESS}:{v}" for v in subprocesses.values())
+    oids.extend(components_uids.values())
+    types.extend(f"{NAMESPACE_DEVICES}:{k}" for k in components_uids)
+    objects = pd.DataFrame({OCEL_OID: oids, OCEL_TYPE: types})
+    objects[DICT_TO_LIST] = pd.Series(payloads + [np.nan] * (len(oids) - len(payloads)), dtype=object)
+
+    # Event-to-object relation in omap order: the event's objects, its lifecycle and its component
+    aids = log_final[CPEE_ACT_ID]
+    aid_codes = codes(aids)
+    with_lifecycle = np.array([not (aid in index.no_lifecycles and aid != DUMMY and aid != NA)
+                               for aid in aids.values] + [False], dtype=bool)[:-1][aid_codes]
+    endpoints = log_final[CONCEPT_ENDPOINT]
+    rel_events = np.concatenate([np.repeat(np.arange(n), np.diff(np.asarray(log_final.offsets, dtype=np.intp))),
+                                 np.flatnonzero(with_lifecycle), np.arange(n)])
+    rel_objects = np.concatenate([values(log_final.objects)[codes(log_final.objects)],
+                                  values(aids)[aid_codes[with_lifecycle]],
+                                  values(endpoints, component_matcher.match)[codes(endpoints)]])
+    order = np.argsort(rel_events, kind='stable')
+    rel_events, rel_objects = rel_events[order], rel_objects[order]
+    object_types = objects.drop_duplicates(OCEL_OID, keep='last').set_index(OCEL_OID)[OCEL_TYPE]
+    relations = pd.DataFrame({OCEL_EID: eids[rel_events], OCEL_ACT: activities[rel_events],
+                              OCEL_TIME: timestamps.take(rel_events).reset_index(drop=True),
+                              OCEL_OID: rel_objects})
+    relations[OCEL_TYPE] = relations[OCEL_OID].map(object_types)
+    # Relations to unknown objects are dropped and every object is related once per event
+    relations = relations.dropna(subset=[OCEL_TYPE]).drop_duplicates([OCEL_EID, OCEL_OID])
+
+    events = events.sort_values(OCEL_TIME, kind='stable')
+    relations = relations.sort_values(OCEL_TIME, kind='stable')
+    ocel = OCEL(events=events, objects=objects, relations=relations, globals=header)
+    ocel = ocel_consistency.apply(ocel)
+    return filtering_utils.propagate_relations_filtering(ocel)
+
+
+def to_pm4py(index_path, trace_dir=None, workers=1, cache_dir=None, cache_limit=CACHE_LIMIT, dedup=False):
+    """Convert the CPEE traces listed in an index.txt to a pm4py OCEL in memory, without writing any file.
+
+    Takes the same options as convert, the subprocesses whose trace could not be read are reported on stdout.
+    """
+    trace_dir = os.path.dirname(index_path) if trace_dir is None else trace_dir
+    indented_text, ots, subprocesses = read_index(index_path)
+    root, jobs = build_tree(indented_text)
+    log_final = EventLog()
+    data = new_data()
+    cache = TraceCache(cache_dir, cache_limit, trace_dir, dedup) if cache_dir is not None else None
+    ingest(jobs, log_final, data, subprocesses, [], workers, cache, trace_dir, dedup)
+    return build_pm4py(log_final, data, ots, subprocesses)
+
+
+class PendingLink(Exception):
+    """An event links a subprocess the index does not list yet"""
+
+
+class LinkTypes:
+    """Subprocess types for follow mode, looking up a subprocess missing from the index raises PendingLink.
+
+    Once given up on waiting for the index, missing subprocesses get the type NA instead.
+    """
+
+    def __init__(self, types):
+        self.types = types
+        self.give_up = False
+
+    def __getitem__(self, oid):
+        try:
+            return self.types[oid]
+        except KeyError:
+            if self.give_up:
+                return NA
+            raise PendingLink(oid) from None
+
+
+class FollowedTrace:
+    __slots__ = ('job', 'offset', 'seen', 'changed', 'waiting', 'activities')
+
+    def __init__(self, job, now):
+        self.job = job
+        # Bytes consumed, size and mtime when last polled, when that changed and since when a link is pending
+        self.offset = 0
+        self.seen = None
+        self.changed = now
+        self.waiting = None
+        # Activity ids whose lifecycle object was emitted
+        self.activities = set()
+
+
+class TraceFollower:
+    """Converts the traces of an index while CPEE still writes them, feeding events to writers as they complete.
+
+    Every poll reads the lines appended to the index and the documents appended to each open trace since the last
+    poll. A document is complete once the next one starts or its trace has not changed for settle seconds. Events of a
+    trace linking a subprocess the index does not list yet are held back until it does, for at most link_timeout
+    seconds. Traces are read in blocks of FOLLOW_BLOCK bytes, each emitted before the next is read. A trace read to
+    its end is retired once it has not changed for retire seconds, later appends to it are not seen. The index is
+    expected to only grow by appended lines, a shorter one is read again from the start.
+
+    Memory grows with the open traces and their activity ids, and with the subprocess types of the index, the
+    components and, with dedup, the ids of distinct payloads, but not with the events.
+
+    Unlike the batch conversion every activity id gets a lifecycle object and endpoints only match the components
+    whose datastreams were seen before them.
+    """
+
+    def __init__(self, index_path, trace_dir=None, writers=(), dedup=False, settle=5.0, link_timeout=60.0,
+                 retire=300.0):
+        self.index_path = index_path
+        self.trace_dir = os.path.dirname(index_path) if trace_dir is None else trace_dir
+        self.writers = list(writers)
+        self.dedup = dedup
+        self.settle = settle
+        self.link_timeout = link_timeout
+        self.retire = retire
+        self.subprocesses = {}
+        self.types = LinkTypes(self.subprocesses)
+        self.traces = {}
+        # Bytes and lines of the index consumed and the open ancestors of its next line
+        self.index_offset = 0
+        self.index_lines = 0
+        self.stack = [Node(f"{ROOT}({str(uuid.uuid4())})")]
+        self.index_changed = False
+        self.components = {}
+        self.matcher = None
+        # Object ids shared by traces: placeholder activity ids and, with dedup, payloads
+        self.shared = set()
+        self.stats = new_data()[STATS]
+        self.events = 0
+        self.objects = 0
+
+    def begin(self):
+        header = {OCEL_GLOBAL: {OCEL_VERSION: "0.1", OCEL_ORDERING: "timestamp", OCEL_ATTN: EVENT_ATTRIBUTES,
+                                OCEL_OBJT: [DATA, DATASTREAM]},
+                  OCEL_GE: {OCEL_ACT: OCEL_NA},
+                  OCEL_GO: {OCEL_TYPE: OCEL_NA}}
+        for writer in self.writers:
+            writer.begin(header)
+        self._component(NA)
+
+    def poll(self, final=False):
+        """Convert what was written since the last poll, returns the number of events emitted.
+
+        A final poll also takes incomplete documents and gives up on pending subprocess links.
+        """
+        now = time.monotonic()
+        events = self.events
+        self._read_index(now)
+        for oid, trace in list(self.traces.items()):
+            if self._read_trace(oid, trace, now, final):
+                del self.traces[oid]
+        for writer in self.writers:
+            writer.flush()
+        return self.events - events
+
+    def run(self, interval=1.0, idle_exit=None):
+        """Poll every interval seconds until interrupted or, with idle_exit, no event came for that many seconds"""
+        self.begin()
+        quiet = time.monotonic()
+        try:
+            while True:
+                if self.poll():
+                    quiet = time.monotonic()
+                elif idle_exit is not None and time.monotonic() - quiet >= idle_exit:
+                    break
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.poll(final=True)
+            for writer in self.writers:
+                writer.close()
+        return {'events': self.events, 'objects': self.objects, **self.stats}
+
+    def _read_index(self, now):
+        self.index_changed = False
+        try:
+            st = os.stat(self.index_path)
+        except FileNotFoundError:
+            return
+        if st.st_size < self.index_offset:
+            # Rewritten from scratch
+            self.index_offset = self.index_lines = 0
+            self.stack = [Node(f"{ROOT}({self.stack[0].oid})")]
+        if st.st_size == self.index_offset:
+            return
+        with open(self.index_path, 'rb') as f:
+            f.seek(self.index_offset)
+            text = f.read(st.st_size - self.index_offset)
+        # A line still being written is picked up by the next poll
+        text = text[:text.rfind(b'\n') + 1]
+        stack = list(self.stack)
+        try:
+            links = list(attach_nodes(stack, index_nodes(text.decode(), self.index_lines + 1)))
+        except ValueError:
+            return
+        self.index_offset += len(text)
+        self.index_lines += text.count(b'\n')
+        self.stack = stack
+        self.index_changed = bool(links)
+        for parent, node in links:
+            if node.oid not in self.subprocesses:
+                self.subprocesses[node.oid] = node.ot
+                self._object(node.oid, {OCEL_TYPE: f"{NAMESPACE_SUBPROCESS}:{node.ot}", OCEL_OVMAP: {}})
+            if node.oid not in self.traces:
+                self.traces[node.oid] = FollowedTrace((parent.ot, node.ot, parent.oid, node.oid), now)
+
+    def _read_trace(self, oid, trace, now, final):
+        """Convert the complete documents appended to a trace, True once the trace is to be retired"""
+        try:
+            st = os.stat(trace_path(oid, self.trace_dir))
+        except FileNotFoundError:
+            return now - trace.changed >= self.retire
+        fresh = (st.st_size, st.st_mtime_ns) != trace.seen
+        if fresh:
+            trace.seen = (st.st_size, st.st_mtime_ns)
+            trace.changed = now
+        if st.st_size < trace.offset:
+            # Rewritten from scratch
+            trace.offset = 0
+        if st.st_size == trace.offset:
+            return trace.waiting is None and now - trace.changed >= self.retire
+        settled = final or now - trace.changed >= self.settle
+        waiting = trace.waiting
+        if waiting is not None:
+            given_up = final or now - waiting >= self.link_timeout
+            if not (self.index_changed or given_up):
+                return False
+        elif fresh or settled:
+            given_up = final
+        else:
+            return False
+        import yaml
+        ot_parent, ot_child, oid_parent, oid_child = trace.job
+        self.types.give_up = given_up
+        trace.waiting = None
+        size = FOLLOW_BLOCK
+        with open(trace_path(oid, self.trace_dir), 'rb') as f:
+            while trace.offset < st.st_size and trace.waiting is None:
+                f.seek(trace.offset)
+                wanted = min(size, st.st_size - trace.offset)
+                chunk = f.read(wanted)
+                last = len(chunk) < wanted or trace.offset + len(chunk) >= st.st_size
+                starts = [0] + [m.start() for m in DOCUMENT_START.finditer(chunk) if m.start()]
+                ends = starts[1:] + ([len(chunk)] if last and settled and chunk.endswith(b'\n') else [])
+                if not ends:
+                    if last:
+                        break
+                    # A document larger than the block
+                    size *= 2
+                    continue
+                size = FOLLOW_BLOCK
+                log = EventLog()
+                e_data = new_data()
+                consumed = 0
+                for start, end in zip(starts, ends):
+                    # The first document of a trace is the log header
+                    if trace.offset + start:
+                        try:
+                            for event in iter_documents(chunk[start:end]):
+                                if isinstance(event, dict) and isinstance(event.get(EVENT), dict):
+                                    append_event(ot_parent, ot_child, oid_parent, oid_child, event, log, e_data,
+                                                 self.types, self.dedup)
+                        except PendingLink:
+                            trace.waiting = now if waiting is None else waiting
+                            break
+                        except yaml.YAMLError:
+                            e_data[STATS][SKIPPED_EVENTS] += 1
+                    consumed = end
+                trace.offset += consumed
+                for k, n in e_data[STATS].items():
+                    self.stats[k] += n
+                self._emit(trace, log, e_data)
+        return False
+
+    def _emit(self, trace, log, e_data):
+        for payload in e_data[DATASTREAM].values():
+            if isinstance(payload, list) and payload and isinstance(payload[0], dict) and \
+                    XES_DATASTREAM_NAME in payload[0]:
+                self._component(payload[0][XES_DATASTREAM_NAME])
+        # Without dedup every payload has an id of its own
+        payloads = self.shared if self.dedup else set()
+        for i in range(len(log)):
+            for kind, key, ot in ((DATA, DATA, DATA), (DATASTREAM, XES_DATASTREAM, DATASTREAM),
+                                  (DATASTREAM, XES_DATACONTEXT, DATASTREAM)):
+                data_id = log[key][i]
+                if data_id in e_data[kind] and data_id not in payloads:
+                    payloads.add(data_id)
+                    self._object(data_id, {OCEL_TYPE: ot, OCEL_OVMAP: {DICT_TO_LIST: e_data[kind][data_id]}})
+            aid = log[CPEE_ACT_ID][i]
+            # Activity uuids belong to one instance, the placeholders of missing ones to all
+            activities = self.shared if aid in (DUMMY, NA, EXTERNAL) else trace.activities
+            if aid not in activities:
+                activities.add(aid)
+                self._object(aid, {OCEL_TYPE: f"{NAMESPACE_LIFECYCLE}:{log[CONCEPT_NAME][i]}", OCEL_OVMAP: {}})
+            event = ocel_event(log, i, log.omap(i) + [aid, self.matcher.match(log[CONCEPT_ENDPOINT][i])])
+            eid = str(uuid.uuid4())
+            for writer in self.writers:
+                writer.event(eid, event)
+            self.events += 1
+
+    def _component(self, name):
+        if name in self.components:
+            return
+        self.components[name] = str(uuid.uuid4())
+        self._object(self.components[name], {OCEL_TYPE: f"{NAMESPACE_DEVICES}:{name}", OCEL_OVMAP: {}})
+        self.matcher = ComponentMatcher({k: v for k, v in self.components.items() if k != NA}, self.components[NA])
+
+    def _object(self, oid, obj):
+        for writer in self.writers:
+            writer.object(oid, obj)
+        self.objects += 1
+
+
+def follow(index_path, trace_dir=None, output=None, sqlite=None, interval=1.0, settle=5.0, link_timeout=60.0,
+           idle_exit=None, dedup=False, retire=300.0):
+    """Convert the traces of an index while they are written, see TraceFollower.
+
+    Events and objects go to output as NDJSON (default out.ndjson next to the index, - for stdout) and to a live
+    SQLite database if its path is given. Runs until interrupted or, with idle_exit, until no new event came for that
+    many seconds. Returns the number of events and objects written along with the counters of convert.
+    """
+    output = os.path.join(os.path.dirname(index_path), 'out.ndjson') if output is None else output
+    writers = [NdjsonOcelWriter(output)]
+    if sqlite is not None:
+        writers.append(SqliteOcelWriter(sqlite, live=True))
+    follower = TraceFollower(index_path, trace_dir, writers, dedup, settle, link_timeout, retire)
+    return follower.run(interval, idle_exit)
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Convert CPEE XES-YAML traces to an object-centric event log.")
+    parser.add_argument('index', nargs='?', default='index.txt', help="indented subprocess index (default: %(default)s)")
+    parser.add_argument('-t', '--trace-dir', help="directory of the {uuid}.xes.yaml traces (default: next to the index)")
+    parser.add_argument('-o', '--output', help="OCEL JSON file, compressed for a .gz suffix "
+                                               "(default: out.jsonocel next to the index)")
+    parser.add_argument('-j', '--workers', type=int, default=1, help="worker processes parsing traces (default: 1)")
+    parser.add_argument('--compact', action='store_true', help="write JSON without indentation")
+    parser.add_argument('--cache-dir', help="directory caching normalized traces between runs")
+    parser.add_argument('--cache-limit', type=int, default=CACHE_LIMIT, help="cache size limit in bytes")
+    parser.add_argument('--dedup', action='store_true', help="store identical data and datastream payloads once")
+    parser.add_argument('--sqlite', help="additionally write an OCEL 2.0 style SQLite database")
+    parser.add_argument('--parquet', help="additionally write events, objects and relations as Parquet tables into "
+                                          "this directory (requires pyarrow)")
+    parser.add_argument('--report', help="JSON run report with the time and memory of each phase and trace "
+                                         "(default: the output path with .report.json appended)")
+    parser.add_argument('--no-report', action='store_true', help="do not write a run report")
+    parser.add_argument('--progress', action='store_true', help="show progress and ETA of the ingestion on stderr")
+    parser.add_argument('--profile', choices=['tree', 'ingest', 'build', 'write'],
+                        help="profile a phase with cProfile into OUTPUT.PHASE.prof, use -j 1 for ingest")
+    parser.add_argument('--follow', action='store_true',
+                        help="keep converting traces as they are written, emitting NDJSON to the output "
+                             "(default: out.ndjson next to the index, - for stdout) and to a live --sqlite database")
+    parser.add_argument('--interval', type=float, default=1.0, help="seconds between polls when following")
+    parser.add_argument('--settle', type=float, default=5.0,
+                        help="seconds a trace has to stay unchanged before its last document is taken when following")
+    parser.add_argument('--retire', type=float, default=300.0,
+                        help="seconds a trace read to its end has to stay unchanged before it is no longer followed")
+    parser.add_argument('--idle-exit', type=float,
+                        help="stop following once no event came for this many seconds (default: run until interrupted)")
+    args = parser.parse_args(argv)
+    if args.follow:
+        if args.parquet is not None:
+            parser.error("--parquet cannot be followed")
+        result = follow(args.index, args.trace_dir, args.output, sqlite=args.sqlite, interval=args.interval,
+                        settle=args.settle, idle_exit=args.idle_exit, dedup=args.dedup, retire=args.retire)
+        summarize(result, args.dedup, sys.stderr)
+        return 0
+    output = os.path.join(os.path.dirname(args.index), 'out.jsonocel') if args.output is None else args.output
+    report = None if args.no_report else f"{output}.report.json" if args.report is None else args.report
+    result = convert(args.index, args.trace_dir, output, workers=args.workers,
+                     indent=None if args.compact else 2, cache_dir=args.cache_dir, cache_limit=args.cache_limit,
+                     sqlite=args.sqlite, parquet=args.parquet, dedup=args.dedup, report=report,
+                     progress=args.progress, profile=args.profile)
+    summarize(result, args.dedup)
+    return 0
+
+
+def summarize(result, dedup=False, file=None):
+    if dedup:
+        print(f"Deduplicated {result[DEDUP_PAYLOADS]} payloads, {result[DEDUP_BYTES]} bytes.", file=file)
+    if result[MALFORMED_RAW]:
+        print(f"Could not decode {result[MALFORMED_RAW]} subprocess receive payloads.", file=file)
+    if result[SKIPPED_EVENTS]:
+        print(f"Skipped {result[SKIPPED_EVENTS]} events without {TIME}.", file=file)
 
-ocel_json[OCEL_OBJECTS] = {**data_objects, **datastream_objects, **lifecycle_objects, **subprocess_objects,
-                           **component_objects}
 
-json.dump(ocel_json, open(PATH_PREFIX + "out.jsonocel", "w"), indent=1, default=json_serial)
+if __name__ == '__main__':
+    sys.exit(main())